@@ -10,27 +10,29 @@ icon_path = 'icon.ico'
 
 a = Analysis(
     ['main.py'],
-    pathex=['src'],
+    pathex=[],
     binaries=[
         (os.path.join(vgamepad_path, 'win', 'vigem', 'client', 'x64', '*.dll'), 'vgamepad/win/vigem/client/x64'),
     ],
     datas=[
         ('config', 'config'),
-        ('src', 'src'),
     ],
     hiddenimports=[
         'vgamepad',
         'pygame',
         'tkinter',
         'json',
+        'orjson',  # Опционально: json_backend берет самую быструю из установленных
+        'ujson',
         'logging',
-        'config_manager',
-        'logger_config',
-        'recorder.gamepad_recorder',
-        'recorder.gamepad_state',
-        'recorder.sequence_manager',
-        'recorder.virtual_gamepad',
-        'ui.overlay_gui',
+        'hkrecorder.config_manager',
+        'hkrecorder.json_backend',
+        'hkrecorder.logger_config',
+        'hkrecorder.recorder.gamepad_recorder',
+        'hkrecorder.recorder.gamepad_state',
+        'hkrecorder.recorder.sequence_manager',
+        'hkrecorder.recorder.virtual_gamepad',
+        'hkrecorder.ui.overlay_gui',
     ],
     hookspath=[],
     hooksconfig={},
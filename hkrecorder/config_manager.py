@@ -0,0 +1,275 @@
+"""Менеджер конфигурации приложения."""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from .json_backend import JSONDecodeError, dumps, loads
+
+logger = logging.getLogger(__name__)
+
+
+def _read_json(path: Path) -> Any:
+    """Прочитать JSON-файл (библиотека выбирается в json_backend)."""
+    return loads(path.read_bytes())
+
+
+def _dump_json(data: Any) -> bytes:
+    """Сериализовать в JSON (UTF-8, отступ 2)."""
+    return dumps(data)
+
+
+# Минимальная конфигурация на случай ошибок загрузки
+_FALLBACK_CONFIG: Dict[str, Any] = {
+    "version": "1.0.0",
+    "gamepad": {
+        "record_button": 8,
+        "play_button": 9,
+        "polling_rate": 100,
+        "stick_deadzone": 0.1,
+        "trigger_deadzone": 0.05,
+        "interference_threshold": 0.2
+    },
+    "recording": {
+        "max_slots": 30,
+        "max_events_per_slot": 100000,
+        "auto_save": True,
+        "backup_on_save": True,
+        "recordings_dir": "recordings"
+    },
+    "ui": {
+        "overlay_enabled": True,
+        "overlay_alpha": 0.92,
+        "always_on_top": True,
+        "update_rate": 10
+    },
+    "playback": {
+        "enable_looping": False,
+        "loop_count": -1
+    },
+    "logging": {
+        "level": "INFO",
+        "console": True
+    }
+}
+
+
+class ConfigManager:
+    """Управление конфигурацией с поддержкой валидации и слияния настроек."""
+
+    DEFAULT_CONFIG_PATH = Path("config/default_config.json")
+    USER_CONFIG_PATH = Path("config/user_config.json")
+
+    def __init__(self, user_config_path: Optional[Path] = None):
+        self.user_config_path = user_config_path or self.USER_CONFIG_PATH
+        self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._config_view: Mapping[str, Any] = MappingProxyType(self._config)
+        self._loaded_mtimes: Optional[tuple] = None
+        self._modified = False
+        self._last_save_hash: Optional[bytes] = None
+        self.load()
+
+    def load(self) -> None:
+        """Загрузить конфигурацию (default + user override)."""
+        # Файлы не менялись с прошлой загрузки - повторный парсинг не нужен
+        mtimes = self._file_mtimes()
+        if mtimes == self._loaded_mtimes and not self._modified:
+            logger.debug("Config files unchanged, skipping reload")
+            return
+
+        try:
+            # Загрузка дефолтной конфигурации
+            self._config = _read_json(self.DEFAULT_CONFIG_PATH)
+            logger.info("Loaded default config from %s", self.DEFAULT_CONFIG_PATH)
+
+            # Загрузка пользовательской конфигурации (если есть)
+            if mtimes[1] is not None:
+                user_config = _read_json(self.user_config_path)
+                self._merge_config(user_config)
+                logger.info("Loaded user config from %s", self.user_config_path)
+        except FileNotFoundError:
+            logger.warning("Config file not found, using defaults")
+            self._config = self._get_fallback_config()
+            mtimes = None
+        except JSONDecodeError as e:
+            logger.error("Invalid JSON in config: %s", e)
+            self._config = self._get_fallback_config()
+            mtimes = None
+        except Exception as e:
+            logger.error("Error loading config: %s", e)
+            self._config = self._get_fallback_config()
+            mtimes = None
+
+        self._loaded_mtimes = mtimes
+        self._modified = False
+        self._rebuild_index()
+
+    def _file_mtimes(self) -> tuple:
+        """Время модификации (default, user) файлов; None если файла нет."""
+        mtimes = []
+        for path in (self.DEFAULT_CONFIG_PATH, self.user_config_path):
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def save_user_config(self) -> bool:
+        """Сохранить текущую конфигурацию как пользовательскую (атомарно)."""
+        try:
+            data = _dump_json(self._config)
+
+            # Ничего не изменилось с прошлого сохранения - пропускаем запись
+            digest = hashlib.blake2b(data).digest()
+            if digest == self._last_save_hash and self.user_config_path.exists():
+                logger.debug("User config unchanged, skipping save")
+                return True
+
+            self.user_config_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.user_config_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.user_config_path)
+
+            self._last_save_hash = digest
+            logger.info("Saved user config to %s", self.user_config_path)
+            return True
+        except Exception as e:
+            logger.error("Failed to save user config: %s", e)
+            return False
+
+    def get(self, key_path: str, default: Any = None) -> Any:
+        """
+        Получить значение по пути (например, 'gamepad.record_button').
+
+        Args:
+            key_path: Путь к значению через точку
+            default: Значение по умолчанию
+        """
+        return self._flat.get(key_path, default)
+
+    def set(self, key_path: str, value: Any) -> None:
+        """Установить значение по пути."""
+        keys = key_path.split('.')
+        config = self._config
+
+        for key in keys[:-1]:
+            if key not in config:
+                config[key] = {}
+            config = config[key]
+
+        config[keys[-1]] = value
+        self._modified = True
+        self._rebuild_index()
+
+    def _merge_config(self, user_config: Dict[str, Any]) -> None:
+        """Слияние пользовательской конфигурации с дефолтной (на месте, без копий)."""
+        stack = [(self._config, user_config)]
+
+        while stack:
+            base, override = stack.pop()
+            for key, value in override.items():
+                if isinstance(value, dict) and isinstance(base.get(key), dict):
+                    stack.append((base[key], value))
+                else:
+                    base[key] = value
+
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Построить плоский индекс {'a.b.c': значение} для быстрого get()."""
+        flat: Dict[str, Any] = {}
+        stack = [('', self._config)]
+
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+
+        self._flat = flat
+        self._config_view = MappingProxyType(self._config)
+
+    def _get_fallback_config(self) -> Dict[str, Any]:
+        """Минимальная конфигурация на случай ошибок."""
+        return deepcopy(_FALLBACK_CONFIG)
+
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Получить всю конфигурацию (только для чтения)."""
+        return self._config_view
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Получить изменяемую глубокую копию конфигурации."""
+        return deepcopy(self._config)
+
+    def app_config(self) -> 'AppConfig':
+        """Получить типизированный снимок настроек приложения."""
+        return AppConfig.from_manager(self)
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """
+    Неизменяемый снимок настроек, которые читает приложение.
+
+    Имя поля - путь в конфигурации с '_' вместо первой точки
+    (gamepad_record_button -> 'gamepad.record_button').
+    """
+
+    gamepad_record_button: int = 8
+    gamepad_play_button: int = 9
+    gamepad_polling_rate: int = 100
+    gamepad_stick_deadzone: float = 0.1
+    gamepad_trigger_deadzone: float = 0.05
+    gamepad_interference_threshold: float = 0.2
+    gamepad_invert_left_stick_y: bool = True
+    gamepad_quantize_sticks: bool = True
+
+    recording_max_slots: int = 30
+    recording_max_events_per_slot: int = 100000
+    recording_auto_save: bool = True
+    recording_backup_on_save: bool = True
+    recording_recordings_dir: str = "recordings"
+
+    ui_overlay_enabled: bool = True
+    ui_overlay_position: str = "top-right"
+    ui_overlay_alpha: float = 0.92
+    ui_overlay_width: int = 200
+    ui_overlay_height: int = 70
+    ui_always_on_top: bool = True
+    ui_update_rate: int = 10
+    ui_theme: str = "dark"
+
+    playback_enable_looping: bool = False
+    playback_loop_count: int = -1
+
+    hotkeys_save: str = "s"
+    hotkeys_load: str = "l"
+    hotkeys_quit: str = "q"
+    hotkeys_toggle_overlay: str = "o"
+    hotkeys_toggle_topmost: str = "t"
+
+    logging_level: str = "INFO"
+    logging_file: Optional[str] = None
+    logging_console: bool = True
+    logging_max_file_size: int = 10485760
+    logging_backup_count: int = 3
+
+    @classmethod
+    def from_manager(cls, manager: ConfigManager) -> 'AppConfig':
+        """Собрать снимок из ConfigManager (отсутствующие ключи - значения по умолчанию)."""
+        return cls(**{
+            f.name: manager.get(f.name.replace('_', '.', 1), f.default)
+            for f in fields(cls)
+        })
@@ -0,0 +1,52 @@
+"""
+Выбор JSON-библиотеки.
+
+Самая быстрая из установленных (orjson > ujson > stdlib json) выбирается
+один раз при импорте; модули вызывают loads()/dumps() без собственных
+try/except ImportError и проверок флагов на каждый вызов.
+"""
+
+import json
+from typing import Any, Callable
+
+# Ошибка разбора выбранной библиотеки (у orjson это подкласс json.JSONDecodeError)
+JSONDecodeError: type = json.JSONDecodeError
+
+try:
+    import orjson
+
+    JSON_BACKEND = "orjson"
+
+    def dumps(data: Any, indent: bool = True) -> bytes:
+        """Сериализовать в UTF-8 JSON (отступ 2 или компактно)."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    # Принимает bytes/memoryview напрямую - без копирования буфера
+    loads: Callable[[Any], Any] = orjson.loads
+    ZERO_COPY_LOADS = True
+
+except ImportError:
+    try:
+        import ujson
+
+        JSON_BACKEND = "ujson"
+        JSONDecodeError = getattr(ujson, 'JSONDecodeError', ValueError)
+
+        def dumps(data: Any, indent: bool = True) -> bytes:
+            """Сериализовать в UTF-8 JSON (отступ 2 или компактно)."""
+            return ujson.dumps(data, indent=2 if indent else 0, ensure_ascii=False).encode('utf-8')
+
+        loads = ujson.loads
+        ZERO_COPY_LOADS = False
+
+    except ImportError:
+        JSON_BACKEND = "json"
+
+        def dumps(data: Any, indent: bool = True) -> bytes:
+            """Сериализовать в UTF-8 JSON (отступ 2 или компактно)."""
+            if indent:
+                return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        loads = json.loads
+        ZERO_COPY_LOADS = False
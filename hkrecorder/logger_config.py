@@ -1,11 +1,15 @@
 """Конфигурация логирования."""
 
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Фоновый поток, выполняющий запись логов (консоль/файл)
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -24,6 +28,8 @@ def setup_logging(
         max_bytes: Максимальный размер файла лога
         backup_count: Количество резервных копий
     """
+    global _listener
+
     # Преобразование строки уровня в константу
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -32,17 +38,28 @@ def setup_logging(
     date_format = '%Y-%m-%d %H:%M:%S'
     formatter = logging.Formatter(log_format, date_format)
 
+    # Формат не использует поток/процесс/место вызова - не собираем их для каждой записи
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
+    # Ошибки форматирования записей не должны печатать traceback из горячего цикла
+    logging.raiseExceptions = False
+
     # Корневой логгер
+    shutdown_logging()
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     root_logger.handlers.clear()  # Удаляем существующие обработчики
+    handlers = []
 
     # Консольный обработчик
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # Файловый обработчик с ротацией
     if log_file:
@@ -57,8 +74,26 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Запись в консоль/файл (и ротация) идёт в фоновом потоке:
+    # вызов logger.* в цикле опроса лишь кладёт запись в очередь
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
 
     # Подавление излишне многословных библиотек
     logging.getLogger('pygame').setLevel(logging.WARNING)
     logging.getLogger('PIL').setLevel(logging.WARNING)
+
+
+def shutdown_logging() -> None:
+    """Дописать накопленные записи и остановить фоновый поток логирования."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -2,6 +2,6 @@
 
 from .gamepad_state import GamepadState
 from .virtual_gamepad import VirtualGamepad
-from .sequence_manager import SequenceManager
+from .sequence_manager import LoadResult, SequenceManager
 
-__all__ = ['GamepadState', 'VirtualGamepad', 'SequenceManager']
+__all__ = ['GamepadState', 'VirtualGamepad', 'SequenceManager', 'LoadResult']
@@ -3,7 +3,10 @@
 import pygame
 import time
 import logging
-from typing import Optional, Callable
+from array import array
+from bisect import bisect_right
+from collections import deque
+from typing import Optional, Callable, Sequence
 from enum import Enum
 from .gamepad_state import GamepadState
 from .virtual_gamepad import VirtualGamepad
@@ -22,6 +25,10 @@ class RecorderState(Enum):
 class GamepadRecorder:
     """Рекордер геймпада с поддержкой записи и воспроизведения."""
 
+    # Биты направлений D-pad для обнаружения фронтов нажатия
+    _HAT_UP = 1
+    _HAT_DOWN = 2
+
     def __init__(
         self,
         record_button: int = 8,
@@ -75,33 +82,76 @@ class GamepadRecorder:
         self.invert_left_stick_y = invert_left_stick_y
         self.quantize_sticks = quantize_sticks
 
+        # Управляющие кнопки не считаются вмешательством при воспроизведении
+        self._control_mask = (
+            GamepadState.button_bit(record_button) | GamepadState.button_bit(play_button)
+        )
+
         # Состояние
         self.state = RecorderState.IDLE
         self.current_slot = 1
         self.max_slots = max_slots
 
-        # Данные записи
-        self.recording_data: list[RecordingEvent] = []
-        self.recording_start_time: float = 0.0
+        # Данные записи: буфер выделяется один раз на max_events событий,
+        # запись идёт по индексу без перераспределения списка
+        self._rec_buf: list[Optional[RecordingEvent]] = [None] * max_events
+        self._rec_len: int = 0
+        self.recording_start_ns: int = 0  # perf_counter_ns() начала записи
         self.recording_last_state: Optional[GamepadState] = None
 
         # Данные воспроизведения
         self.playback_index: int = 0
-        self.playback_start_time: float = 0.0
+        self.playback_start_ns: int = 0  # perf_counter_ns() начала воспроизведения
+        self._playback_times: Sequence[float] = []  # Времена событий для бинарного поиска
+        # Воспроизводимая последовательность, фиксируется в start_playback
+        # (слот меняется только в IDLE, поэтому ссылка остаётся актуальной)
+        self._active_sequence: Sequence[RecordingEvent] = []
+        self._active_len: int = 0
+        self._last_event_time: float = 0.0
         self.playback_initial_state: Optional[GamepadState] = None
         self.playback_loop: bool = False
         self.playback_loop_count: int = 0
         self.playback_max_loops: int = -1  # -1 = бесконечно
-        self.playback_delays: list[float] = []  # Задержки для анализа
+        # Задержки для анализа (мс), хранятся как C double без объектов float
+        self.playback_delays: array = array('d')
+
+        # Состояние геймпада, прочитанное один раз за кадр (RECORDING/PLAYING)
+        self._frame_state: Optional[GamepadState] = None
 
         # Debounce для кнопок
         self.button_states: dict[int, bool] = {}
 
+        # Направления D-pad на прошлом кадре (биты _HAT_UP/_HAT_DOWN)
+        self._hat_prev_mask: int = 0
+
+        # Кнопки, нажатые за текущий кадр (по событиям JOYBUTTONDOWN).
+        # Ловит короткие нажатия, отпущенные между двумя опросами
+        self.pressed_events: deque[int] = deque(maxlen=32)
+        self.joystick_instance_id: Optional[int] = None
+
+        # Методы и размеры джойстика, кэшируемые при инициализации
+        self._get_button: Optional[Callable[[int], bool]] = None
+        self._get_axis: Optional[Callable[[int], float]] = None
+        self._get_hat: Optional[Callable[[int], tuple]] = None
+        self._nbuttons: int = 0
+        self._naxes: int = 0
+        self._nhats: int = 0
+        self._deadzones: tuple[float, ...] = ()
+
+        # Уровень логирования задаётся до создания рекордера - проверяем один раз,
+        # а не на каждом кадре записи
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         # Callback для обновления UI
         self.on_state_change: Optional[Callable] = None
         self.on_slot_change: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
 
+    @property
+    def recording_data(self) -> list[RecordingEvent]:
+        """События текущей записи (копия заполненной части буфера)."""
+        return self._rec_buf[:self._rec_len]
+
     def initialize_joystick(self) -> bool:
         """
         Инициализировать физический геймпад.
@@ -118,16 +168,29 @@ class GamepadRecorder:
 
             self.joystick = pygame.joystick.Joystick(0)
             self.joystick.init()
+            self.joystick_instance_id = self.joystick.get_instance_id()
+
+            # Опрос идёт каждый кадр - не ищем методы и размеры заново
+            self._get_button = self.joystick.get_button
+            self._get_axis = self.joystick.get_axis
+            self._get_hat = self.joystick.get_hat
+            self._nbuttons = self.joystick.get_numbuttons()
+            self._naxes = self.joystick.get_numaxes()
+            self._nhats = self.joystick.get_numhats()
+            self._deadzones = GamepadState.deadzone_vector(
+                self._naxes, self.stick_deadzone, self.trigger_deadzone
+            )
 
             logger.info(
-                f"Подключен геймпад: {self.joystick.get_name()}, "
-                f"кнопок: {self.joystick.get_numbuttons()}, "
-                f"осей: {self.joystick.get_numaxes()}"
+                "Подключен геймпад: %s, кнопок: %s, осей: %s",
+                self.joystick.get_name(),
+                self._nbuttons,
+                self._naxes
             )
             return True
 
         except Exception as e:
-            logger.error(f"Ошибка инициализации геймпада: {e}")
+            logger.error("Ошибка инициализации геймпада: %s", e)
             if self.on_error:
                 self.on_error(f"Ошибка геймпада: {e}")
             return False
@@ -143,30 +206,20 @@ class GamepadRecorder:
             return None
 
         try:
-            state = GamepadState(
-                buttons=[
-                    self.joystick.get_button(i)
-                    for i in range(self.joystick.get_numbuttons())
-                ],
-                axes=[
-                    round(self.joystick.get_axis(i), 3)
-                    for i in range(self.joystick.get_numaxes())
-                ],
-                hats=[
-                    self.joystick.get_hat(i)
-                    for i in range(self.joystick.get_numhats())
-                ] if self.joystick.get_numhats() > 0 else []
-            )
-
-            # Применение dead zone
-            return state.apply_deadzone(
-                self.stick_deadzone,
-                self.trigger_deadzone,
-                self.quantize_sticks
+            get_button = self._get_button
+            get_axis = self._get_axis
+            get_hat = self._get_hat
+            # Dead zone применяется к сырым значениям: строится только итоговое состояние
+            return GamepadState.from_raw(
+                buttons=tuple([get_button(i) for i in range(self._nbuttons)]),
+                axes=tuple([round(get_axis(i), 3) for i in range(self._naxes)]),
+                hats=tuple([get_hat(i) for i in range(self._nhats)]),
+                deadzones=self._deadzones,
+                quantize_sticks=self.quantize_sticks
             )
 
         except Exception as e:
-            logger.error(f"Ошибка чтения состояния геймпада: {e}")
+            logger.error("Ошибка чтения состояния геймпада: %s", e)
             return None
 
     def is_button_just_pressed(self, button_id: int) -> bool:
@@ -183,14 +236,22 @@ class GamepadRecorder:
             return False
 
         try:
-            is_pressed = self.joystick.get_button(button_id)
+            frame_state = self._frame_state
+            if frame_state is not None:
+                is_pressed = frame_state.buttons[button_id]
+            else:
+                is_pressed = self._get_button(button_id)
             was_pressed = self.button_states.get(button_id, False)
             self.button_states[button_id] = is_pressed
 
+            if button_id in self.pressed_events:
+                self.pressed_events.remove(button_id)
+                return True
+
             return is_pressed and not was_pressed
 
         except Exception as e:
-            logger.error(f"Ошибка проверки кнопки {button_id}: {e}")
+            logger.error("Ошибка проверки кнопки %s: %s", button_id, e)
             return False
 
     def check_interference(self, initial_state: GamepadState) -> bool:
@@ -203,24 +264,21 @@ class GamepadRecorder:
         Returns:
             True если обнаружено вмешательство
         """
-        current = self.get_current_state()
+        current = self._frame_state or self.get_current_state()
         if not current:
             return False
 
         try:
-            # Проверка кнопок (кроме управляющих)
-            for i, (initial_btn, current_btn) in enumerate(zip(initial_state.buttons, current.buttons)):
-                if i in [self.record_button, self.play_button]:
-                    continue
-
-                if not initial_btn and current_btn:
-                    logger.debug(f"Вмешательство: кнопка {i}")
-                    return True
+            # Проверка кнопок (кроме управляющих): нажатые сейчас, но не в начале
+            newly_pressed = current.buttons_mask & ~initial_state.buttons_mask & ~self._control_mask
+            if newly_pressed:
+                logger.debug("Вмешательство: кнопка %s", (newly_pressed.bit_length() - 1) // 8)
+                return True
 
             # Проверка осей
             for i, (initial_axis, current_axis) in enumerate(zip(initial_state.axes, current.axes)):
                 if abs(current_axis - initial_axis) > self.interference_threshold:
-                    logger.debug(f"Вмешательство: ось {i}")
+                    logger.debug("Вмешательство: ось %s", i)
                     return True
 
             # Проверка hat-ов
@@ -231,7 +289,7 @@ class GamepadRecorder:
             return False
 
         except Exception as e:
-            logger.error(f"Ошибка проверки вмешательства: {e}")
+            logger.error("Ошибка проверки вмешательства: %s", e)
             return False
 
     # === ЗАПИСЬ ===
@@ -239,15 +297,15 @@ class GamepadRecorder:
     def start_recording(self) -> bool:
         """Начать запись."""
         if self.state != RecorderState.IDLE:
-            logger.warning(f"Невозможно начать запись в состоянии {self.state}")
+            logger.warning("Невозможно начать запись в состоянии %s", self.state)
             return False
 
         self.state = RecorderState.RECORDING
-        self.recording_data = []
+        self._rec_len = 0
         self.recording_last_state = None
-        self.recording_start_time = time.time()
+        self.recording_start_ns = time.perf_counter_ns()
 
-        logger.info(f"Начата запись в слот {self.current_slot}")
+        logger.info("Начата запись в слот %s", self.current_slot)
 
         if self.on_state_change:
             self.on_state_change(self.state, self.current_slot, 0)
@@ -259,36 +317,39 @@ class GamepadRecorder:
         if self.state != RecorderState.RECORDING:
             return
 
-        current_state = self.get_current_state()
+        current_state = self._frame_state or self.get_current_state()
         if not current_state:
             return
 
-        current_time = time.time() - self.recording_start_time
+        current_time = (time.perf_counter_ns() - self.recording_start_ns) * 1e-9
 
         # Записываем ВСЕ изменения без порога для максимальной точности
         # Критично для быстрых комбинаций (прыжок + вниз + атака за 10-20ms)
-        if self.recording_last_state is None or current_state != self.recording_last_state:
-            event = RecordingEvent(time=current_time, state=current_state)
-            self.recording_data.append(event)
+        last_state = self.recording_last_state
+        if last_state is None or current_state.differs(last_state):
+            count = self._rec_len
+            self._rec_buf[count] = RecordingEvent(time=current_time, state=current_state)
+            count += 1
+            self._rec_len = count
 
             # DEBUG: логируем изменения для диагностики (только в DEBUG режиме)
-            if logger.isEnabledFor(logging.DEBUG) and self.recording_last_state:
+            if __debug__ and self._debug_enabled and last_state:
                 # Логируем только значимые изменения кнопок и осей
-                for i, (old, new) in enumerate(zip(self.recording_last_state.buttons, current_state.buttons)):
+                for i, (old, new) in enumerate(zip(last_state.buttons, current_state.buttons)):
                     if old != new:
-                        logger.debug(f"[{current_time:.4f}s] BUTTON {i}: {old} -> {new}")
-                for i, (old, new) in enumerate(zip(self.recording_last_state.axes, current_state.axes)):
+                        logger.debug("[%.4fs] BUTTON %s: %s -> %s", current_time, i, old, new)
+                for i, (old, new) in enumerate(zip(last_state.axes, current_state.axes)):
                     if abs(old - new) > 0.01:
-                        logger.debug(f"[{current_time:.4f}s] AXIS {i}: {old:.3f} -> {new:.3f}")
+                        logger.debug("[%.4fs] AXIS %s: %.3f -> %.3f", current_time, i, old, new)
 
             self.recording_last_state = current_state
 
             # Периодически уведомляем UI
-            if len(self.recording_data) % 10 == 0 and self.on_state_change:
-                self.on_state_change(self.state, self.current_slot, len(self.recording_data))
+            if count % 10 == 0 and self.on_state_change:
+                self.on_state_change(self.state, self.current_slot, count)
 
             # Проверка переполнения
-            if len(self.recording_data) >= self.sequence_manager.max_events_per_slot:
+            if count >= len(self._rec_buf):
                 logger.warning("Достигнут лимит событий, остановка записи")
                 self.stop_recording()
 
@@ -297,14 +358,14 @@ class GamepadRecorder:
         if self.state != RecorderState.RECORDING:
             return False
 
-        count = len(self.recording_data)
+        count = self._rec_len
         success = self.sequence_manager.set_sequence(
             self.current_slot,
-            self.recording_data
+            self._rec_buf[:count]
         )
 
         if success:
-            logger.info(f"Запись остановлена: {count} событий")
+            logger.info("Запись остановлена: %s событий", count)
         else:
             logger.error("Ошибка сохранения записи")
 
@@ -319,20 +380,30 @@ class GamepadRecorder:
         """
         Продолжить запись после вмешательства.
 
+        События копируются в буфер записи одной срезовой операцией;
+        список events_before после вызова не используется и может
+        быть временным (например, срез воспроизводимой последовательности).
+
         Args:
             events_before: События до вмешательства
             time_offset: Смещение времени
         """
         self.state = RecorderState.RECORDING
-        self.recording_data = list(events_before)
+        self._rec_len = len(events_before)
+        self._rec_buf[:self._rec_len] = events_before
         self.recording_last_state = events_before[-1].state if events_before else None
-        self.recording_start_time = time.time() - time_offset
+        self.recording_start_ns = time.perf_counter_ns() - int(time_offset * 1e9)
 
-        logger.info(f"Продолжение записи (было {len(events_before)} событий)")
+        logger.info("Продолжение записи (было %s событий)", len(events_before))
 
         if self.on_state_change:
             self.on_state_change(self.state, self.current_slot, len(events_before))
 
+        # Буфер уже заполнен - дописывать некуда
+        if self._rec_len >= len(self._rec_buf):
+            logger.warning("Достигнут лимит событий, остановка записи")
+            self.stop_recording()
+
     # === ВОСПРОИЗВЕДЕНИЕ ===
 
     def start_playback(self, loop: bool = False, loop_count: int = -1) -> bool:
@@ -347,13 +418,13 @@ class GamepadRecorder:
             True если успешно
         """
         if self.state != RecorderState.IDLE:
-            logger.warning(f"Невозможно начать воспроизведение в состоянии {self.state}")
+            logger.warning("Невозможно начать воспроизведение в состоянии %s", self.state)
             return False
 
         sequence = self.sequence_manager.get_sequence(self.current_slot)
 
         if not sequence:
-            logger.warning(f"Слот {self.current_slot} пуст")
+            logger.warning("Слот %s пуст", self.current_slot)
             if self.on_error:
                 self.on_error("Нет записи в слоте")
             return False
@@ -376,16 +447,20 @@ class GamepadRecorder:
 
         self.state = RecorderState.PLAYING
         self.playback_index = 0
-        self.playback_start_time = time.time()
+        self._active_sequence = sequence
+        self._active_len = len(sequence)
+        self._last_event_time = sequence[-1].time
+        self._playback_times = self.sequence_manager.get_times(self.current_slot)
+        self.playback_start_ns = time.perf_counter_ns()
         self.playback_initial_state = self.get_current_state()
         self.playback_loop = loop
         self.playback_loop_count = 0
         self.playback_max_loops = loop_count
-        self.playback_delays = []  # Сброс статистики
+        self.playback_delays = array('d')  # Сброс статистики
 
         logger.info(
-            f"Начато воспроизведение слота {self.current_slot} "
-            f"({len(sequence)} событий, зацикливание: {loop})"
+            "Начато воспроизведение слота %s (%s событий, зацикливание: %s)",
+            self.current_slot, len(sequence), loop
         )
 
         if self.on_state_change:
@@ -398,39 +473,35 @@ class GamepadRecorder:
         if self.state != RecorderState.PLAYING:
             return
 
-        sequence = self.sequence_manager.get_sequence(self.current_slot)
+        sequence = self._active_sequence
         if not sequence:
             self.stop_playback()
             return
 
-        current_time = time.time() - self.playback_start_time
+        current_time = (time.perf_counter_ns() - self.playback_start_ns) * 1e-9
 
         # Применяем все события, которые должны произойти
         # ВАЖНО: применяем ВСЕ пропущенные события сразу, чтобы сохранить интервалы
-        events_applied = 0
-        while self.playback_index < len(sequence):
-            event = sequence[self.playback_index]
-
-            # Если событие ещё не должно произойти, ждём
-            if event.time > current_time:
-                break
+        # Граница ищется бинарным поиском по отсортированным временам событий
+        new_index = bisect_right(self._playback_times, current_time, self.playback_index)
+        add_delay = self.playback_delays.append
+        apply_state = self.virtual_gamepad.apply_state
+        for i in range(self.playback_index, new_index):
+            event = sequence[i]
 
             # Собираем статистику задержек (всегда)
-            delay_ms = (current_time - event.time) * 1000
-            self.playback_delays.append(delay_ms)
+            add_delay((current_time - event.time) * 1000)
 
-            self.virtual_gamepad.apply_state(event.state)
-            self.playback_index += 1
-            events_applied += 1
+            apply_state(event.state)
+        self.playback_index = new_index
 
         # Если применили несколько событий за один кадр, это нормально
         # Это сохраняет быстрые комбинации (например, нажатие и отпускание за 10ms)
 
         # Проверка завершения
-        if self.playback_index >= len(sequence):
+        if self.playback_index >= self._active_len:
             # Добавляем задержку 0.2с после последнего события, чтобы персонаж успел завершить движение
-            last_event_time = sequence[-1].time if sequence else 0
-            time_since_last_event = current_time - last_event_time
+            time_since_last_event = current_time - self._last_event_time
 
             if time_since_last_event < 0.2:
                 # Ждём завершения последнего движения
@@ -439,9 +510,9 @@ class GamepadRecorder:
             if self.playback_loop and (self.playback_max_loops == -1 or self.playback_loop_count < self.playback_max_loops):
                 # Перезапуск
                 self.playback_index = 0
-                self.playback_start_time = time.time()
+                self.playback_start_ns = time.perf_counter_ns()
                 self.playback_loop_count += 1
-                logger.debug(f"Повтор #{self.playback_loop_count}")
+                logger.debug("Повтор #%s", self.playback_loop_count)
             else:
                 self.stop_playback("Завершено")
                 return
@@ -458,6 +529,8 @@ class GamepadRecorder:
 
             logger.info("Обнаружено вмешательство, переход к дозаписи")
             self.virtual_gamepad.reset()
+            self._active_sequence = []
+            self._active_len = 0
             self.continue_recording(events_before, time_offset)
 
     def stop_playback(self, message: str = "Остановлено") -> None:
@@ -467,21 +540,23 @@ class GamepadRecorder:
 
         self.virtual_gamepad.reset()
         self.state = RecorderState.IDLE
+        self._active_sequence = []
+        self._active_len = 0
 
-        logger.info(f"Воспроизведение остановлено: {message}")
+        logger.info("Воспроизведение остановлено: %s", message)
 
         # Статистика задержек (только в DEBUG режиме)
-        if self.playback_delays and logger.isEnabledFor(logging.DEBUG):
+        if self.playback_delays and self._debug_enabled:
             avg_delay = sum(self.playback_delays) / len(self.playback_delays)
             max_delay = max(self.playback_delays)
             min_delay = min(self.playback_delays)
             logger.debug(
-                f"Timing stats: events={len(self.playback_delays)} "
-                f"avg={avg_delay:+.2f}ms max={max_delay:+.2f}ms min={min_delay:+.2f}ms"
+                "Timing stats: events=%s avg=%+.2fms max=%+.2fms min=%+.2fms",
+                len(self.playback_delays), avg_delay, max_delay, min_delay
             )
 
         if self.on_state_change:
-            count = len(self.sequence_manager.get_sequence(self.current_slot))
+            count, _ = self.sequence_manager.slot_info(self.current_slot)
             self.on_state_change(self.state, self.current_slot, count)
 
     # === УПРАВЛЕНИЕ СЛОТАМИ ===
@@ -502,14 +577,14 @@ class GamepadRecorder:
 
         new_slot = self.current_slot + delta
         if new_slot < 1 or new_slot > self.max_slots:
-            logger.debug(f"Слот {new_slot} вне диапазона")
+            logger.debug("Слот %s вне диапазона", new_slot)
             return False
 
         self.current_slot = new_slot
-        logger.info(f"Переключение на слот {self.current_slot}")
+        logger.info("Переключение на слот %s", self.current_slot)
 
         if self.on_slot_change:
-            count = len(self.sequence_manager.get_sequence(self.current_slot))
+            count, _ = self.sequence_manager.slot_info(self.current_slot)
             self.on_slot_change(self.current_slot, count)
 
         return True
@@ -520,33 +595,64 @@ class GamepadRecorder:
             return False
 
         self.current_slot = slot
-        logger.info(f"Переход к слоту {self.current_slot}")
+        logger.info("Переход к слоту %s", self.current_slot)
 
         if self.on_slot_change:
-            count = len(self.sequence_manager.get_sequence(self.current_slot))
+            count, _ = self.sequence_manager.slot_info(self.current_slot)
             self.on_slot_change(self.current_slot, count)
 
         return True
 
     # === УПРАВЛЕНИЕ ===
 
-    def process_input(self) -> None:
-        """Обработка ввода (вызывается каждый кадр)."""
+    def process_events_batch(self, events: list) -> None:
+        """
+        Обработать события джойстика, накопленные за кадр, и ввод.
+
+        Очередь уже прокачана вызовом pygame.event.get(), которым получены
+        events, поэтому process_input() повторно её не прокачивает.
+
+        Args:
+            events: События pygame (JOYBUTTONDOWN/UP, JOYAXISMOTION, JOYHATMOTION)
+        """
+        for event in events:
+            if (event.type == pygame.JOYBUTTONDOWN
+                    and event.instance_id == self.joystick_instance_id):
+                self.pressed_events.append(event.button)
+
+        self.process_input(pump=False)
+        self.pressed_events.clear()
+
+    def process_input(self, pump: bool = True) -> None:
+        """
+        Обработка ввода (вызывается каждый кадр).
+
+        Args:
+            pump: Прокачать очередь событий SDL (обновляет состояние джойстика)
+        """
         if not self.joystick:
             return
 
         try:
-            pygame.event.pump()
+            if pump:
+                pygame.event.pump()
 
             if self.state == RecorderState.IDLE:
                 self._process_idle_input()
-            elif self.state == RecorderState.RECORDING:
-                self._process_recording_input()
-            elif self.state == RecorderState.PLAYING:
-                self._process_playing_input()
+            else:
+                # Один опрос геймпада на кадр: кнопки управления, запись
+                # и проверка вмешательства читают это же состояние
+                self._frame_state = self.get_current_state()
+
+                if self.state == RecorderState.RECORDING:
+                    self._process_recording_input()
+                elif self.state == RecorderState.PLAYING:
+                    self._process_playing_input()
 
         except Exception as e:
-            logger.error(f"Ошибка обработки ввода: {e}")
+            logger.error("Ошибка обработки ввода: %s", e)
+        finally:
+            self._frame_state = None
 
     def _process_idle_input(self) -> None:
         """Обработка ввода в режиме IDLE."""
@@ -559,24 +665,21 @@ class GamepadRecorder:
             self.start_playback()
 
         # Переключение слотов через D-pad
-        if self.joystick and self.joystick.get_numhats() > 0:
-            hat = self.joystick.get_hat(0)
-
-            # Вверх
-            if hat[1] == 1:
-                if not self.button_states.get('hat_up', False):
-                    self.change_slot(1)
-                    self.button_states['hat_up'] = True
-            else:
-                self.button_states['hat_up'] = False
+        if self._nhats > 0:
+            hat_y = self._get_hat(0)[1]
+            current = (
+                (self._HAT_UP if hat_y == 1 else 0)
+                | (self._HAT_DOWN if hat_y == -1 else 0)
+            )
 
-            # Вниз
-            if hat[1] == -1:
-                if not self.button_states.get('hat_down', False):
-                    self.change_slot(-1)
-                    self.button_states['hat_down'] = True
-            else:
-                self.button_states['hat_down'] = False
+            # Только что нажатые направления
+            edges = current & ~self._hat_prev_mask
+            self._hat_prev_mask = current
+
+            if edges & self._HAT_UP:
+                self.change_slot(1)
+            elif edges & self._HAT_DOWN:
+                self.change_slot(-1)
 
     def _process_recording_input(self) -> None:
         """Обработка ввода в режиме RECORDING."""
@@ -596,4 +699,7 @@ class GamepadRecorder:
         if self.state == RecorderState.PLAYING:
             self.virtual_gamepad.reset()
 
+        # Дописать отложенное автосохранение
+        self.sequence_manager.flush()
+
         pygame.quit()
@@ -0,0 +1,242 @@
+"""Работа с состоянием геймпада."""
+
+from dataclasses import dataclass, field
+from typing import Tuple, Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class GamepadState:
+    """
+    Состояние геймпада в определенный момент времени.
+
+    Поля - неизменяемые кортежи фиксированной длины: сравнение
+    кнопок и hat-ов выполняется одной C-операцией, копирование не нужно.
+    """
+
+    # Допуск дрожания осей в differs()/__eq__
+    AXIS_TOLERANCE = 0.08
+
+    buttons: Tuple[bool, ...] = ()
+    axes: Tuple[float, ...] = ()
+    hats: Tuple[Tuple[int, int], ...] = ()
+
+    # Производные значения (заполняются в __post_init__). Объявлены полями,
+    # чтобы попасть в __slots__: у состояния нет __dict__, что при сотнях
+    # тысяч событий в слотах заметно экономит память
+    buttons_mask: int = field(init=False, repr=False, compare=False)
+    axes_q: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _key: tuple = field(init=False, repr=False, compare=False)
+    xusb: Optional[Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Кнопки, упакованные в одно целое (по байту на кнопку, см. button_bit):
+        # сравнение и поиск новых нажатий - одна целочисленная операция
+        self.buttons_mask = int.from_bytes(bytes(self.buttons), 'little')
+        # Оси в фиксированной точке (сотые доли): только для ключа точного
+        # совпадения, порог в differs() сравнивает исходные float-оси
+        self.axes_q = tuple([round(a * 100) for a in self.axes])
+        # Ключ точного совпадения: неизменный между кадрами ввод
+        # отсекается одним сравнением кортежей
+        self._key = (self.buttons_mask, self.axes_q, self.hats)
+        # Значения отчёта XUSB, вычисляются VirtualGamepad при первом применении
+        self.xusb = None
+
+    @staticmethod
+    def button_bit(button_id: int) -> int:
+        """Бит кнопки button_id в buttons_mask."""
+        return 1 << (8 * button_id)
+
+    def __eq__(self, other: object) -> bool:
+        """Сравнение состояний с учетом округления осей."""
+        if not isinstance(other, GamepadState):
+            return False
+        return not self.differs(other)
+
+    def differs(self, other: 'GamepadState') -> bool:
+        """
+        Быстрая проверка изменения состояния (без проверки типа).
+
+        Используется в цикле записи: целое сравнение кнопок и hat-ов;
+        порог осей (по float) применяется, только если оси изменились.
+        """
+        # Точное совпадение - самый частый случай при опросе 100+ Гц
+        if self._key == other._key:
+            return False
+
+        # Сравнение кнопок
+        if self.buttons_mask != other.buttons_mask:
+            return True
+
+        # Сравнение hat-ов
+        if self.hats != other.hats:
+            return True
+
+        # Сравнение осей с порогом 0.08 (8% от диапазона)
+        # Это фильтрует мелкие дрожания стика при записи. Целые axes_q
+        # только отсекают неизменные оси; порог проверяется по float,
+        # чтобы округление не сдвигало его границу
+        if self.axes_q != other.axes_q:
+            if len(self.axes) != len(other.axes):
+                return True
+            for a, b in zip(self.axes, other.axes):
+                if abs(a - b) > self.AXIS_TOLERANCE:
+                    return True
+
+        return False
+
+    @staticmethod
+    def deadzone_vector(
+        axis_count: int,
+        stick_deadzone: float = 0.1,
+        trigger_deadzone: float = 0.05
+    ) -> Tuple[float, ...]:
+        """
+        Построить мертвые зоны по осям: стики (оси 0-3), триггеры (4-5 и далее).
+
+        Результат можно вычислить один раз и передавать в apply_deadzone().
+        """
+        return tuple(
+            stick_deadzone if i < 4 else trigger_deadzone
+            for i in range(axis_count)
+        )
+
+    def apply_deadzone(
+        self,
+        stick_deadzone: float = 0.1,
+        trigger_deadzone: float = 0.05,
+        quantize_sticks: bool = False,
+        deadzones: Optional[Tuple[float, ...]] = None
+    ) -> 'GamepadState':
+        """
+        Применить dead zone к осям.
+
+        Args:
+            stick_deadzone: Мертвая зона для стиков (оси 0-3)
+            trigger_deadzone: Мертвая зона для триггеров (оси 4-5)
+            quantize_sticks: Квантовать стики до -1.0, 0.0, 1.0 (для точного воспроизведения)
+            deadzones: Готовый вектор мертвых зон (см. deadzone_vector);
+                если задан, stick_deadzone/trigger_deadzone игнорируются
+
+        Returns:
+            Новое состояние с примененными dead zones
+        """
+        if deadzones is None:
+            deadzones = self.deadzone_vector(len(self.axes), stick_deadzone, trigger_deadzone)
+
+        return GamepadState(
+            buttons=self.buttons,
+            axes=self._deadzone_axes(self.axes, deadzones, quantize_sticks),
+            hats=self.hats
+        )
+
+    @classmethod
+    def from_raw(
+        cls,
+        buttons: Tuple[bool, ...],
+        axes: Tuple[float, ...],
+        hats: Tuple[Tuple[int, int], ...],
+        deadzones: Tuple[float, ...],
+        quantize_sticks: bool = False
+    ) -> 'GamepadState':
+        """
+        Создать состояние из сырых значений джойстика сразу с dead zone.
+
+        То же, что GamepadState(...).apply_deadzone(...), но без промежуточного
+        сырого состояния: производные поля (маска, ключ) считаются один раз.
+        """
+        return cls(
+            buttons=buttons,
+            axes=cls._deadzone_axes(axes, deadzones, quantize_sticks),
+            hats=hats
+        )
+
+    @staticmethod
+    def _deadzone_axes(
+        axes: Tuple[float, ...],
+        deadzones: Tuple[float, ...],
+        quantize_sticks: bool
+    ) -> Tuple[float, ...]:
+        """Оси с примененными dead zone (см. apply_deadzone)."""
+        new_axes = []
+        append = new_axes.append
+
+        for value, deadzone in zip(axes, deadzones):
+            magnitude = abs(value)
+            if magnitude < deadzone:
+                append(0.0)
+                continue
+
+            # Масштабируем значение после dead zone
+            sign = 1.0 if value > 0 else -1.0
+            scaled = (magnitude - deadzone) / (1.0 - deadzone)
+
+            # Квантование для детерминированного воспроизведения:
+            # наклон > 50% считаем полным нажатием
+            if quantize_sticks:
+                append(sign if scaled > 0.5 else 0.0)
+            else:
+                append(sign * scaled)
+
+        return tuple(new_axes)
+
+    def has_significant_change(
+        self,
+        other: 'GamepadState',
+        axis_threshold: float = 0.05
+    ) -> bool:
+        """
+        Проверить, есть ли значительные изменения между состояниями.
+
+        Args:
+            other: Другое состояние для сравнения
+            axis_threshold: Порог изменения осей
+
+        Returns:
+            True если есть значительные изменения
+        """
+        # Проверка кнопок
+        if self.buttons_mask != other.buttons_mask:
+            return True
+
+        # Проверка осей
+        if len(self.axes) != len(other.axes):
+            return True
+
+        for a, b in zip(self.axes, other.axes):
+            if abs(a - b) > axis_threshold:
+                return True
+
+        # Проверка hat-ов
+        if self.hats != other.hats:
+            return True
+
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразовать в словарь для сериализации."""
+        # Без asdict(): он рекурсивно копирует каждый элемент
+        return {
+            'buttons': list(self.buttons),
+            'axes': list(self.axes),
+            'hats': [list(h) for h in self.hats]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'GamepadState':
+        """Создать из словаря."""
+        return cls(
+            buttons=tuple(data.get('buttons', ())),
+            axes=tuple(data.get('axes', ())),
+            hats=tuple(tuple(h) for h in data.get('hats', ()))
+        )
+
+    def copy(self) -> 'GamepadState':
+        """Создать копию состояния (поля неизменяемы и разделяются)."""
+        return GamepadState(
+            buttons=self.buttons,
+            axes=self.axes,
+            hats=self.hats
+        )
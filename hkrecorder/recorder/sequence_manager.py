@@ -0,0 +1,817 @@
+"""Sequence recording management."""
+
+import base64
+import gzip
+import logging
+import mmap
+import os
+import shutil
+import sys
+import threading
+import time
+from array import array
+from collections.abc import Sequence
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import datetime
+from dataclasses import dataclass, field
+from ..json_backend import JSONDecodeError, ZERO_COPY_LOADS, dumps as _dumps, loads as _loads
+from .gamepad_state import GamepadState
+
+logger = logging.getLogger(__name__)
+
+
+# (unix second, ISO string) of the last formatted timestamp
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time as ISO string (second resolution, formatted once per second)."""
+    global _iso_cache
+    second = int(time.time())
+    if second != _iso_cache[0]:
+        _iso_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _iso_cache[1]
+
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Read a JSON file, plain or gzip-compressed (detected by magic bytes).
+
+    Parsed with the backend picked by json_backend. If it accepts buffers
+    (orjson), the file is memory-mapped and parsed straight from the page
+    cache, without first copying it into a bytes object.
+    """
+    if ZERO_COPY_LOADS:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        if view[:2] == _GZIP_MAGIC:
+                            return _loads(gzip.decompress(view))
+                        return _loads(view)
+        return _loads(b'')  # Empty file: raise the usual decode error
+
+    data = path.read_bytes()
+    if data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return _loads(data)
+
+
+def _write_json(
+    path: Path,
+    data: Any,
+    indent: bool = True,
+    compress: bool = False,
+    backups: int = 0
+) -> None:
+    """
+    Write data as UTF-8 JSON (fastest installed backend, see json_backend).
+
+    Args:
+        path: Target file
+        data: JSON-serializable data
+        indent: 2-space indent (human-readable) or compact separators
+        compress: gzip the output (fast level; _read_json detects it)
+        backups: Keep this many previous versions as <name>.1.bak (newest) .. <name>.N.bak
+    """
+    payload = _dumps(data, indent)
+    if compress:
+        payload = gzip.compress(payload, compresslevel=1)
+
+    # Write next to the target and swap in atomically: a crash mid-write
+    # leaves the previous file intact
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+    if backups > 0 and path.exists():
+        _rotate_backups(path, backups)
+
+    os.replace(tmp_path, path)
+
+
+def _rotate_backups(path: Path, count: int, keep: bool = True) -> None:
+    """
+    Shift the backup ring of path by one and make path the newest backup (.1.bak).
+
+    Args:
+        path: File to back up
+        count: Ring size
+        keep: Leave path in place - the backup is a hard link (a copy where
+            links are unsupported), so the caller's os.replace() is the only
+            step that touches the target. With keep=False path is moved away.
+    """
+    def backup_path(n: int) -> Path:
+        return path.with_name(f"{path.name}.{n}.bak")
+
+    for n in range(count - 1, 0, -1):
+        older = backup_path(n)
+        if older.exists():
+            os.replace(older, backup_path(n + 1))
+
+    newest = backup_path(1)
+    if not keep:
+        os.replace(path, newest)
+        return
+
+    newest.unlink(missing_ok=True)
+    try:
+        os.link(path, newest)
+    except OSError:
+        shutil.copy2(path, newest)
+
+
+@dataclass(slots=True)
+class RecordingEvent:
+    """Recording event with timestamp."""
+    time: float
+    state: GamepadState
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            'time': self.time,
+            'state': self.state.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RecordingEvent':
+        """Create from dictionary."""
+        return cls(
+            time=data['time'],
+            state=GamepadState.from_dict(data['state'])
+        )
+
+
+# array typecodes of the binary event columns (stored little-endian, base64)
+_COLUMN_TYPES = {'time': 'd', 'buttons': 'B', 'axes': 'd', 'hats': 'b'}
+_COLUMN_ENCODING = 'base64-le'
+
+
+def _pack_column(typecode: str, values: Iterable) -> str:
+    """Pack numbers into a typed array and return it base64-encoded."""
+    column = array(typecode, values)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return base64.b64encode(column.tobytes()).decode('ascii')
+
+
+def _unpack_column(typecode: str, encoded: str) -> array:
+    """Inverse of _pack_column()."""
+    column = array(typecode)
+    column.frombytes(base64.b64decode(encoded))
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+
+class EventSequence(Sequence):
+    """
+    Read-only event list backed by decoded columns.
+
+    Loading a slot only decodes its typed-array columns; RecordingEvent /
+    GamepadState objects are built on first access to an index and then
+    kept, so looped playback does not rebuild them.
+    """
+
+    __slots__ = ('times', '_buttons', '_axes', '_hats', '_widths', '_count', '_events')
+
+    def __init__(self, times, buttons, axes, hats, widths: Tuple[int, int, int]):
+        nb, na, nh = widths
+        count = len(times)
+        if len(buttons) != count * nb or len(axes) != count * na or len(hats) != count * nh * 2:
+            raise ValueError("column lengths do not match event count")
+
+        self.times = times
+        self._buttons = buttons
+        self._axes = axes
+        self._hats = hats
+        self._widths = widths
+        self._count = count
+        self._events: List[Optional[RecordingEvent]] = [None] * count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("event index out of range")
+
+        event = self._events[index]
+        if event is None:
+            nb, na, nh = self._widths
+            h = self._hats[index * nh * 2:(index + 1) * nh * 2]
+            event = self._events[index] = RecordingEvent(
+                time=self.times[index],
+                state=GamepadState(
+                    buttons=tuple(map(bool, self._buttons[index * nb:(index + 1) * nb])),
+                    axes=tuple(self._axes[index * na:(index + 1) * na]),
+                    hats=tuple(zip(h[0::2], h[1::2]))
+                )
+            )
+        return event
+
+    def encode(self) -> Dict[str, Any]:
+        """Columns in the on-disk layout, without building any events."""
+        nb, na, nh = self._widths
+        return {
+            'encoding': _COLUMN_ENCODING,
+            'buttons_count': nb,
+            'axes_count': na,
+            'hats_count': nh,
+            'time': _pack_column('d', self.times),
+            'buttons': _pack_column('B', self._buttons),
+            'axes': _pack_column('d', self._axes),
+            'hats': _pack_column('b', self._hats)
+        }
+
+
+def _encode_events(events: Sequence[RecordingEvent]) -> Dict[str, Any]:
+    """
+    Encode events column-wise (structure of arrays).
+
+    Every field is one typed array (base64 in JSON) instead of a
+    {'time', 'state': {...}} object per event; per-event widths are
+    stored once.
+    """
+    if isinstance(events, EventSequence):
+        return events.encode()
+
+    first = events[0].state if events else GamepadState()
+    states = [event.state for event in events]
+    return {
+        'encoding': _COLUMN_ENCODING,
+        'buttons_count': len(first.buttons),
+        'axes_count': len(first.axes),
+        'hats_count': len(first.hats),
+        'time': _pack_column('d', [event.time for event in events]),
+        'buttons': base64.b64encode(
+            b''.join([bytes(state.buttons) for state in states])
+        ).decode('ascii'),
+        'axes': _pack_column('d', chain.from_iterable([state.axes for state in states])),
+        'hats': _pack_column('b', chain.from_iterable(
+            [v for hat in state.hats for v in hat] for state in states
+        ))
+    }
+
+
+def _event_times(events: Sequence[RecordingEvent]) -> Sequence[float]:
+    """Times column of events (shared with EventSequence, no copy)."""
+    if isinstance(events, EventSequence):
+        return events.times
+    return [event.time for event in events]
+
+
+def _decode_events(data: Dict[str, Any]) -> Sequence[RecordingEvent]:
+    """
+    Decode events from a slot/export payload.
+
+    Columnar payloads ('columns', typed arrays or plain lists) become a
+    lazy EventSequence; the legacy per-event list ('events') written by
+    older versions is decoded eagerly.
+    """
+    if 'columns' not in data:
+        return [RecordingEvent.from_dict(event_data) for event_data in data.get('events', [])]
+
+    columns = data['columns']
+    names = ('time', 'buttons', 'axes', 'hats')
+    if columns.get('encoding') == _COLUMN_ENCODING:
+        values = [_unpack_column(_COLUMN_TYPES[name], columns[name]) for name in names]
+    else:
+        values = [array(_COLUMN_TYPES[name], columns[name]) for name in names]
+
+    widths = (columns['buttons_count'], columns['axes_count'], columns['hats_count'])
+    return EventSequence(*values, widths=widths)
+
+
+@dataclass(slots=True)
+class SlotMetadata:
+    """Slot metadata."""
+    name: str = ""
+    created_at: Optional[str] = None
+    modified_at: Optional[str] = None
+    event_count: int = 0
+    duration: float = 0.0
+
+    def to_dict(self) -> dict:
+        # Plain literal: asdict() walks fields() and deep-copies on every save
+        return {
+            'name': self.name,
+            'created_at': self.created_at,
+            'modified_at': self.modified_at,
+            'event_count': self.event_count,
+            'duration': self.duration
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SlotMetadata':
+        return cls(**data)
+
+
+@dataclass
+class LoadResult:
+    """Summary of a successful load_from_file() call."""
+    loaded_slots: int
+    current_slot: int
+    current_slot_count: int
+    current_slot_name: str
+    skipped_slots: List[int] = field(default_factory=list)  # Unreadable/corrupt slots
+
+
+class SequenceManager:
+    """Sequence recording management with save/load support."""
+
+    FILE_VERSION = "2.1.0"  # 2.1: columnar event layout, one file per slot
+    _CURRENT_MAJOR = FILE_VERSION.partition('.')[0]
+
+    # Layout: index.json (metadata of all slots) + gzipped slot_NN.json.gz per slot.
+    # sequences.json is the pre-2.1 single-file layout, still loadable.
+    INDEX_FILE = "index.json"
+    LEGACY_FILE = "sequences.json"
+
+    # Auto-save is coalesced: one write this many seconds after the last change
+    AUTO_SAVE_DELAY = 0.5
+
+    # Previous versions kept per file on save(backup=True): name.1.bak .. name.N.bak
+    BACKUP_COUNT = 2
+
+    def __init__(
+        self,
+        max_slots: int = 30,
+        max_events_per_slot: int = 100000,
+        recordings_dir: str = "recordings",
+        auto_save: bool = True
+    ):
+        self.max_slots = max_slots
+        self.max_events_per_slot = max_events_per_slot
+        self.recordings_dir = Path(recordings_dir)
+        self.recordings_dir.mkdir(parents=True, exist_ok=True)
+        self.auto_save = auto_save
+
+        # Sequences: {slot_id: events} - a list, or an EventSequence for loaded slots
+        self.sequences: Dict[int, Sequence[RecordingEvent]] = {
+            i: [] for i in range(1, max_slots + 1)
+        }
+
+        # Event times per slot (parallel to sequences, for binary search)
+        self._times: Dict[int, Sequence[float]] = {
+            i: [] for i in range(1, max_slots + 1)
+        }
+
+        # Slot metadata
+        self.metadata: Dict[int, SlotMetadata] = {
+            i: SlotMetadata() for i in range(1, max_slots + 1)
+        }
+
+        # Debounced auto-save (runs on a timer thread, see _schedule_save)
+        self._lock = threading.RLock()
+        self._dirty_slots: Set[int] = set()
+        self._save_timer: Optional[threading.Timer] = None
+
+    def get_sequence(self, slot: int) -> Sequence[RecordingEvent]:
+        """Get sequence for slot."""
+        if slot not in self.sequences:
+            logger.warning("Attempt to get non-existent slot %s", slot)
+            return []
+        return self.sequences[slot]
+
+    def get_times(self, slot: int) -> Sequence[float]:
+        """
+        Get event times for slot (sorted, parallel to get_sequence()).
+
+        Playback uses this list with bisect to find the due events.
+        """
+        return self._times.get(slot, [])
+
+    def set_sequence(
+        self,
+        slot: int,
+        events: Sequence[RecordingEvent],
+        name: str = ""
+    ) -> bool:
+        """
+        Set sequence for slot.
+
+        Args:
+            slot: Slot number
+            events: Events
+            name: Recording name
+
+        Returns:
+            True if successful
+        """
+        if slot not in self.sequences:
+            logger.error("Invalid slot number: %s", slot)
+            return False
+
+        if len(events) > self.max_events_per_slot:
+            logger.error("Too many events: %s > %s", len(events), self.max_events_per_slot)
+            return False
+
+        now = _now_iso()
+        duration = events[-1].time if events else 0.0
+
+        with self._lock:
+            self.sequences[slot] = events
+            self._times[slot] = _event_times(events)
+
+            # Update metadata
+            if not self.metadata[slot].created_at:
+                self.metadata[slot].created_at = now
+
+            self.metadata[slot].name = name or self.metadata[slot].name
+            self.metadata[slot].modified_at = now
+            self.metadata[slot].event_count = len(events)
+            self.metadata[slot].duration = duration
+            self._dirty_slots.add(slot)
+
+        logger.info("Slot %s updated: %s events, %.2fs", slot, len(events), duration)
+
+        # Auto-save shortly after the recording is updated, off the input loop
+        if self.auto_save and events:
+            self._schedule_save()
+
+        return True
+
+    def clear_slot(self, slot: int) -> bool:
+        """Clear slot."""
+        if slot not in self.sequences:
+            return False
+
+        with self._lock:
+            self.sequences[slot] = []
+            self._times[slot] = []
+            self.metadata[slot] = SlotMetadata()
+            self._dirty_slots.add(slot)
+        logger.info("Slot %s cleared", slot)
+        return True
+
+    def get_metadata(self, slot: int) -> Optional[SlotMetadata]:
+        """Get slot metadata."""
+        return self.metadata.get(slot)
+
+    def slot_info(self, slot: int) -> Tuple[int, str]:
+        """
+        Get slot event count and name without touching the event list.
+
+        Returns:
+            (event_count, name); (0, "") for a non-existent slot
+        """
+        meta = self.metadata.get(slot)
+        if meta is None:
+            return 0, ""
+        return meta.event_count, meta.name
+
+    def rename_slot(self, slot: int, name: str) -> bool:
+        """Rename slot."""
+        if slot not in self.metadata:
+            return False
+
+        with self._lock:
+            self.metadata[slot].name = name
+            self._dirty_slots.add(slot)
+        logger.info("Slot %s renamed to '%s'", slot, name)
+
+        if self.auto_save:
+            self._schedule_save()
+
+        return True
+
+    def slot_path(self, slot: int) -> Path:
+        """Path of the file holding one slot's events."""
+        return self.recordings_dir / f"slot_{slot:02d}.json.gz"
+
+    def save_to_file(self, backup: bool = True, full: bool = False) -> bool:
+        """
+        Save sequences: changed slot files plus the metadata index.
+
+        Args:
+            backup: Keep previous versions of each rewritten or removed file
+                (BACKUP_COUNT .N.bak files)
+            full: Rewrite every slot file, not only slots changed since the last save
+
+        Returns:
+            True if successful
+        """
+        # Saves may come from the auto-save timer and the UI at the same time
+        with self._lock:
+            try:
+                slots = (
+                    range(1, self.max_slots + 1) if full
+                    else sorted(self._dirty_slots)
+                )
+
+                for slot_id in slots:
+                    slot_path = self.slot_path(slot_id)
+                    events = self.sequences[slot_id]
+
+                    if events:
+                        self._write_file(
+                            slot_path, self._slot_payload(slot_id), backup, compress=True
+                        )
+                    elif slot_path.exists():
+                        # Cleared slot: drop its file (into the backup ring if enabled)
+                        self._remove_file(slot_path, backup)
+
+                # Index is tiny - always rewritten
+                index = {
+                    'version': self.FILE_VERSION,
+                    'saved_at': _now_iso(),
+                    'slots': {
+                        str(slot_id): self.metadata[slot_id].to_dict()
+                        for slot_id, events in self.sequences.items()
+                        if events
+                    }
+                }
+                self._write_file(self.recordings_dir / self.INDEX_FILE, index, backup)
+                self._dirty_slots.clear()
+
+                logger.info("Sequences saved to %s", self.recordings_dir)
+                return True
+
+            except Exception as e:
+                logger.error("Save error: %s", e)
+                return False
+
+    def _slot_payload(self, slot: int) -> Dict[str, Any]:
+        """Serializable contents of one slot (also the export format)."""
+        return {
+            'version': self.FILE_VERSION,
+            'slot': slot,
+            'metadata': self.metadata[slot].to_dict(),
+            'columns': _encode_events(self.sequences[slot])
+        }
+
+    def _write_file(
+        self,
+        path: Path,
+        data: Dict[str, Any],
+        backup: bool,
+        compress: bool = False
+    ) -> None:
+        """Write a compact JSON file, optionally rotating the old one into the .N.bak ring."""
+        # Compact: this is the auto-save path, exports stay indented
+        _write_json(
+            path, data, indent=False, compress=compress,
+            backups=self.BACKUP_COUNT if backup else 0
+        )
+
+    def _remove_file(self, path: Path, backup: bool) -> None:
+        """Remove a file, optionally moving it into the .N.bak ring instead."""
+        if backup and self.BACKUP_COUNT > 0:
+            _rotate_backups(path, self.BACKUP_COUNT, keep=False)
+        else:
+            path.unlink()
+
+    def _schedule_save(self) -> None:
+        """Schedule a coalesced auto-save AUTO_SAVE_DELAY seconds from now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.AUTO_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> bool:
+        """
+        Write pending auto-save changes now and cancel the scheduled save.
+
+        Returns:
+            True if nothing was pending or the save succeeded
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty_slots:
+                return True
+            return self.save_to_file(backup=False)
+
+    def load_from_file(
+        self,
+        filename: str = LEGACY_FILE,
+        current_slot: int = 1
+    ) -> Optional[LoadResult]:
+        """
+        Load sequences from the recordings directory.
+
+        Reads the per-slot layout (index.json). Without an index, slot files
+        found on disk are loaded directly (index lost in a crash); only when
+        there are none either does it fall back to the single-file layout in
+        `filename`.
+
+        Args:
+            filename: Legacy single-file name
+            current_slot: Slot to report in the result (for UI refresh)
+
+        Returns:
+            LoadResult if successful, None otherwise
+        """
+        index_path = self.recordings_dir / self.INDEX_FILE
+        recovered_slots: List[int] = []
+        legacy = False
+        if index_path.exists():
+            filepath = index_path
+        else:
+            recovered_slots = self._slot_files_on_disk()
+            if recovered_slots:
+                filepath = self.recordings_dir
+            else:
+                filepath = self.recordings_dir / filename
+                legacy = True
+
+        if not filepath.exists():
+            logger.warning("File not found: %s", filepath)
+            return None
+
+        try:
+            if recovered_slots:
+                # Slot files are newer than any legacy file - never fall back past them
+                logger.warning("%s missing, loading slot files directly", index_path)
+                data = {
+                    'version': self.FILE_VERSION,
+                    'slots': {str(slot_id): {} for slot_id in recovered_slots}
+                }
+            else:
+                data = _read_json(filepath)
+
+            # Version validation
+            file_version = data.get('version', '1.0.0')
+            if not self._is_compatible_version(file_version):
+                logger.error("Incompatible file version: %s", file_version)
+                return None
+
+            # Load slots
+            slots_data = data.get('slots', {})
+            loaded_count = 0
+            skipped: List[int] = []
+
+            for slot_str, slot_data in slots_data.items():
+                slot_id = int(slot_str)
+
+                if slot_id not in self.sequences:
+                    logger.warning("Skipping slot %s (out of range)", slot_id)
+                    continue
+
+                # One unreadable slot must not abort loading the others
+                try:
+                    if not legacy:
+                        # Index entry is the metadata; events live in the slot file
+                        slot_path = self.slot_path(slot_id)
+                        if not slot_path.exists():
+                            logger.warning("Slot %s: file %s missing", slot_id, slot_path)
+                            skipped.append(slot_id)
+                            continue
+                        slot_data = _read_json(slot_path)
+
+                    # Load events
+                    events = _decode_events(slot_data)
+                except Exception as e:
+                    logger.error("Slot %s: failed to load, skipped: %s", slot_id, e)
+                    skipped.append(slot_id)
+                    continue
+
+                # Validate event count
+                if len(events) > self.max_events_per_slot:
+                    logger.warning("Slot %s: too many events (%s), truncated", slot_id, len(events))
+                    events = events[:self.max_events_per_slot]
+
+                with self._lock:
+                    self.sequences[slot_id] = events
+                    self._times[slot_id] = _event_times(events)
+
+                    # Load metadata
+                    if 'metadata' in slot_data:
+                        self.metadata[slot_id] = SlotMetadata.from_dict(slot_data['metadata'])
+                    self.metadata[slot_id].event_count = len(events)
+
+                    # Legacy slots are rewritten in the per-slot layout on next save
+                    if legacy:
+                        self._dirty_slots.add(slot_id)
+
+                loaded_count += 1
+
+            logger.info("Loaded %s slots from %s", loaded_count, filepath)
+            if skipped:
+                logger.warning("Skipped slots: %s", skipped)
+            count, name = self.slot_info(current_slot)
+            return LoadResult(
+                loaded_slots=loaded_count,
+                current_slot=current_slot,
+                current_slot_count=count,
+                current_slot_name=name,
+                skipped_slots=skipped
+            )
+
+        except JSONDecodeError as e:
+            logger.error("JSON error: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Load error: %s", e)
+            return None
+
+    def _slot_files_on_disk(self) -> List[int]:
+        """Slot numbers that have a slot_NN.json.gz file in the recordings directory."""
+        slots = []
+        for path in self.recordings_dir.glob("slot_*.json.gz"):
+            number = path.name[len("slot_"):-len(".json.gz")]
+            if number.isdigit():
+                slots.append(int(number))
+        return sorted(slots)
+
+    def export_slot(self, slot: int, filename: str) -> bool:
+        """Export single slot."""
+        if slot not in self.sequences or not self.sequences[slot]:
+            logger.error("Slot %s is empty or doesn't exist", slot)
+            return False
+
+        try:
+            filepath = self.recordings_dir / filename
+            data = self._slot_payload(slot)
+            data['exported_at'] = _now_iso()
+
+            _write_json(filepath, data)
+
+            logger.info("Slot %s exported to %s", slot, filepath)
+            return True
+
+        except Exception as e:
+            logger.error("Export error: %s", e)
+            return False
+
+    def import_slot(self, filename: str, target_slot: int) -> bool:
+        """Import slot from file."""
+        if target_slot not in self.sequences:
+            logger.error("Invalid target slot: %s", target_slot)
+            return False
+
+        try:
+            filepath = self.recordings_dir / filename
+
+            if not filepath.exists():
+                logger.error("File not found: %s", filepath)
+                return False
+
+            data = _read_json(filepath)
+
+            # Validation
+            if 'events' not in data and 'columns' not in data:
+                logger.error("Invalid file format")
+                return False
+
+            events = _decode_events(data)
+
+            if len(events) > self.max_events_per_slot:
+                logger.warning("Too many events, truncated to %s", self.max_events_per_slot)
+                events = events[:self.max_events_per_slot]
+
+            with self._lock:
+                self.sequences[target_slot] = events
+                self._times[target_slot] = _event_times(events)
+
+                # Import metadata
+                if 'metadata' in data:
+                    self.metadata[target_slot] = SlotMetadata.from_dict(data['metadata'])
+                self.metadata[target_slot].event_count = len(events)
+                self._dirty_slots.add(target_slot)
+
+            logger.info("Slot imported to %s", target_slot)
+            return True
+
+        except Exception as e:
+            logger.error("Import error: %s", e)
+            return False
+
+    def _is_compatible_version(self, version: str) -> bool:
+        """Check file version compatibility."""
+        return version.partition('.')[0] == self._CURRENT_MAJOR
+
+    def get_slot_summary(self) -> List[Tuple[int, str, int, float]]:
+        """
+        Get summary of all slots.
+
+        Returns:
+            List[(slot_id, name, event_count, duration)]
+        """
+        summary = []
+        for slot_id in range(1, self.max_slots + 1):
+            meta = self.metadata[slot_id]
+            summary.append((
+                slot_id,
+                meta.name or f"Slot {slot_id}",
+                meta.event_count,
+                meta.duration
+            ))
+        return summary
@@ -0,0 +1,185 @@
+"""Управление виртуальным геймпадом через vgamepad."""
+
+import logging
+from typing import Optional
+from .gamepad_state import GamepadState
+
+logger = logging.getLogger(__name__)
+
+try:
+    import vgamepad as vg
+    VGAMEPAD_AVAILABLE = True
+except ImportError:
+    VGAMEPAD_AVAILABLE = False
+    logger.warning("vgamepad не установлен - воспроизведение недоступно")
+
+
+class VirtualGamepad:
+    """Обертка над vgamepad с обработкой ошибок."""
+
+    # Маппинг кнопок pygame -> Xbox
+    BUTTON_MAP = {
+        0: 'XUSB_GAMEPAD_A',
+        1: 'XUSB_GAMEPAD_B',
+        2: 'XUSB_GAMEPAD_X',
+        3: 'XUSB_GAMEPAD_Y',
+        4: 'XUSB_GAMEPAD_LEFT_SHOULDER',
+        5: 'XUSB_GAMEPAD_RIGHT_SHOULDER',
+        6: 'XUSB_GAMEPAD_BACK',
+        7: 'XUSB_GAMEPAD_START',
+        8: 'XUSB_GAMEPAD_LEFT_THUMB',
+        9: 'XUSB_GAMEPAD_RIGHT_THUMB',
+    }
+
+    def __init__(self, invert_left_stick_y: bool = True):
+        self.gamepad: Optional[vg.VX360Gamepad] = None
+        self.available = VGAMEPAD_AVAILABLE
+        self.invert_left_stick_y = invert_left_stick_y
+
+        # Объекты кнопок XUSB (заполняются в _initialize)
+        self._button_objs: dict = {}
+        self._dpad_up = self._dpad_down = self._dpad_left = self._dpad_right = 0
+
+        self._initialize()
+
+    def _initialize(self) -> None:
+        """Инициализировать виртуальный геймпад."""
+        if not self.available:
+            logger.error("vgamepad недоступен")
+            return
+
+        try:
+            self.gamepad = vg.VX360Gamepad()
+
+            # Разрешаем имена кнопок один раз, а не в каждом apply_state()
+            self._button_objs = {
+                i: int(getattr(vg.XUSB_BUTTON, name)) for i, name in self.BUTTON_MAP.items()
+            }
+            self._dpad_up = int(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_UP)
+            self._dpad_down = int(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_DOWN)
+            self._dpad_left = int(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_LEFT)
+            self._dpad_right = int(vg.XUSB_BUTTON.XUSB_GAMEPAD_DPAD_RIGHT)
+
+            logger.info("Виртуальный геймпад создан успешно")
+        except Exception as e:
+            logger.error("Ошибка создания виртуального геймпада: %s", e)
+            self.available = False
+            self.gamepad = None
+
+    def apply_state(self, state: GamepadState) -> bool:
+        """
+        Применить состояние к виртуальному геймпаду.
+
+        Args:
+            state: Состояние для применения
+
+        Returns:
+            True если успешно
+        """
+        if not self.available or not self.gamepad:
+            return False
+
+        try:
+            # Перевод в целые значения XUSB выполняется один раз на состояние
+            # (повторы при зацикленном воспроизведении берут готовый кортеж)
+            values = state.xusb
+            if values is None:
+                values = state.xusb = self._to_report_values(state)
+
+            # Поля отчёта XUSB пишутся напрямую; драйвер получает их одним update()
+            report = self.gamepad.report
+            (report.wButtons,
+             report.sThumbLX, report.sThumbLY,
+             report.sThumbRX, report.sThumbRY,
+             report.bLeftTrigger, report.bRightTrigger) = values
+
+            # Отправка обновления
+            self.gamepad.update()
+            return True
+
+        except Exception as e:
+            logger.error("Ошибка применения состояния: %s", e)
+            return False
+
+    def _to_report_values(self, state: GamepadState) -> tuple:
+        """
+        Перевести состояние в поля отчёта XUSB.
+
+        Returns:
+            (wButtons, sThumbLX, sThumbLY, sThumbRX, sThumbRY, bLeftTrigger, bRightTrigger);
+            отсутствующие у геймпада оси дают нейтральные значения
+        """
+        axes = state.axes
+        axis_count = len(axes)
+        lx = ly = rx = ry = left_trigger = right_trigger = 0
+
+        # Левый стик
+        if axis_count >= 2:
+            y_value = axes[1]
+            # Инвертируем Y если нужно (для совместимости с разными геймпадами)
+            if self.invert_left_stick_y:
+                y_value = -y_value
+            lx = int(axes[0] * 32767)
+            ly = int(y_value * 32767)
+
+        # Правый стик
+        if axis_count >= 4:
+            rx = int(axes[2] * 32767)
+            ry = int(axes[3] * 32767)
+
+        # Триггеры (значения от -1 до 1, преобразуем в 0-255)
+        if axis_count >= 5:
+            left_trigger = int((axes[4] + 1) * 127.5)
+        if axis_count >= 6:
+            right_trigger = int((axes[5] + 1) * 127.5)
+
+        return (self._button_mask(state), lx, ly, rx, ry, left_trigger, right_trigger)
+
+    def _button_mask(self, state: GamepadState) -> int:
+        """Маска кнопок XUSB (включая D-pad) для состояния."""
+        button_objs = self._button_objs
+        mask = 0
+        for i, pressed in enumerate(state.buttons):
+            if pressed and i in button_objs:
+                mask |= button_objs[i]
+
+        # D-pad
+        if state.hats:
+            hat_x, hat_y = state.hats[0]
+            if hat_y == 1:
+                mask |= self._dpad_up
+            elif hat_y == -1:
+                mask |= self._dpad_down
+            if hat_x == -1:
+                mask |= self._dpad_left
+            elif hat_x == 1:
+                mask |= self._dpad_right
+
+        return mask
+
+    def reset(self) -> bool:
+        """
+        Сбросить виртуальный геймпад в нейтральное состояние.
+
+        Returns:
+            True если успешно
+        """
+        if not self.available or not self.gamepad:
+            return False
+
+        try:
+            self.gamepad.reset()
+            self.gamepad.update()
+            logger.debug("Виртуальный геймпад сброшен")
+            return True
+        except Exception as e:
+            logger.error("Ошибка сброса виртуального геймпада: %s", e)
+            return False
+
+    def __del__(self):
+        """Очистка при удалении объекта."""
+        if self.gamepad:
+            try:
+                self.reset()
+            except:
+                pass
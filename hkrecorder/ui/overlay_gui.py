@@ -0,0 +1,599 @@
+"""Минималистичный оверлей 2025."""
+
+import tkinter as tk
+from tkinter import font as tkfont
+from typing import Optional, Callable
+from enum import Enum
+import logging
+import math
+import re
+
+logger = logging.getLogger(__name__)
+
+# Фаза пульсации (0..1) для каждого из 60 кадров цикла анимации
+_PULSE_TABLE = tuple((math.sin(i * 0.1) + 1) / 2 for i in range(60))
+
+# Цвета пульсации квантуются до _PULSE_LEVELS оттенков: соседние кадры
+# с тем же оттенком не перерисовываются
+_PULSE_LEVELS = 8
+_PULSE_LEVEL = tuple(round(p * (_PULSE_LEVELS - 1)) for p in _PULSE_TABLE)
+
+# Цвет темы: #rrggbb
+_HEX_COLOR = re.compile(r'#[0-9a-fA-F]{6}')
+
+
+class OverlayPosition(Enum):
+    """Позиции оверлея."""
+    TOP_LEFT = "top-left"
+    TOP_RIGHT = "top-right"
+    BOTTOM_LEFT = "bottom-left"
+    BOTTOM_RIGHT = "bottom-right"
+
+
+class OverlayGUI:
+    """Минималистичный оверлей с анимациями."""
+
+    # Статусы с пульсирующей рамкой
+    ANIMATED_STATUSES = frozenset(("recording", "playing"))
+
+    # Единый такт отрисовки (анимация и изменения статуса): не чаще 20 раз в секунду
+    FRAME_INTERVAL_MS = 50
+
+    def __init__(
+        self,
+        position: str = "top-right",
+        alpha: float = 0.95,
+        width: int = 300,
+        height: int = 130,
+        always_on_top: bool = True,
+        theme: str = "dark"
+    ):
+        """
+        Инициализация оверлея.
+
+        Args:
+            position: Позиция на экране
+            alpha: Прозрачность (0.0-1.0)
+            width: Ширина окна
+            height: Высота окна
+            always_on_top: Всегда поверх других окон
+            theme: Тема оформления
+        """
+        self.root = tk.Tk()
+        self.width = width
+        self.height = height
+        self.alpha = alpha
+        self.always_on_top = always_on_top
+
+        # Настройка окна
+        self.root.title("Gamepad Recorder")
+        self.root.attributes('-alpha', alpha)
+        self.root.overrideredirect(True)
+
+        if always_on_top:
+            self.root.attributes('-topmost', True)
+
+        # Размер экрана запрашивается у оконной системы один раз
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
+
+        # Позиционирование
+        self._set_position(position)
+
+        # Цветовая схема
+        self._load_theme(theme)
+
+        # Canvas для рисования
+        self.canvas = tk.Canvas(
+            self.root,
+            width=width,
+            height=height,
+            bg=self.card_bg,
+            highlightthickness=0,
+            bd=0
+        )
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        # Современные шрифты
+        self.title_font = tkfont.Font(family="Segoe UI", size=14, weight="bold")
+        self.slot_font = tkfont.Font(family="Segoe UI", size=22, weight="bold")
+        self.label_font = tkfont.Font(family="Segoe UI", size=9)
+        self.status_font = tkfont.Font(family="Segoe UI", size=11, weight="bold")
+        self.count_font = tkfont.Font(family="Segoe UI", size=18, weight="bold")
+        self.hint_font = tkfont.Font(family="Segoe UI", size=7)
+        self.message_font = tkfont.Font(family="Segoe UI", size=11, weight="bold")
+
+        # Состояние
+        self.current_status = "idle"
+        self.current_slot = 1
+        self.event_count = 0
+        self.slot_name = ""
+        self._slot_display = "#1"
+        self.close_requested = False
+
+        # Анимация
+        self.animation_frame = 0
+        self.pulse_alpha = 0.0
+
+        # Оптимизация обновлений: update_status только помечает оверлей
+        # грязным, рисует _frame_tick (такт планируется, лишь пока есть работа)
+        self._frame_after_id: Optional[str] = None
+        self._dirty = False
+        self._last_update_data = None
+        self._last_anim_key = None
+
+        # Временное сообщение (элементы создаются в _create_items)
+        self._message_after_id: Optional[str] = None
+
+        # Перетаскивание
+        self.canvas.bind('<Button-1>', self._start_move)
+        self.canvas.bind('<B1-Motion>', self._do_move)
+        self.canvas.bind('<Double-Button-1>', self._on_close)
+        self.canvas.bind('<Button-3>', self._show_context_menu)
+        self.root.bind('<Map>', self._resume_drawing)
+        self.root.bind('<Destroy>', self._on_destroy)
+        self.offset_x = 0
+        self.offset_y = 0
+        self._pending_pos: Optional[tuple] = None
+        self._move_after_id: Optional[str] = None
+
+        # Контекстное меню создается один раз и переиспользуется
+        self._ctx_menu = tk.Menu(self.root, tearoff=0)
+        self._ctx_menu.add_command(label="Toggle Always On Top", command=self.toggle_topmost)
+        self._ctx_menu.add_separator()
+        self._ctx_menu.add_command(label="Close", command=self._on_close)
+
+        # Callback
+        self.on_close: Optional[Callable] = None
+
+        # Начальная отрисовка (в idle анимация не запускается)
+        self._create_items()
+        self.draw_ui()
+
+    def _set_position(self, position: str) -> None:
+        """Установить позицию окна."""
+        screen_width = self._screen_w
+        screen_height = self._screen_h
+        margin = 20
+
+        positions = {
+            "top-right": (screen_width - self.width - margin, margin),
+            "top-left": (margin, margin),
+            "bottom-right": (screen_width - self.width - margin, screen_height - self.height - margin),
+            "bottom-left": (margin, screen_height - self.height - margin)
+        }
+
+        x, y = positions.get(position, positions["top-right"])
+        self.root.geometry(f'{self.width}x{self.height}+{x}+{y}')
+
+    def _load_theme(self, theme: str) -> None:
+        """Загрузить цветовую схему."""
+        themes = {
+            "dark": {
+                "card_bg": "#1a1a1a",
+                "text": "#ffffff",
+                "text_secondary": "#a0a0a0",
+                "text_dim": "#6b6b6b",
+                "accent_idle": "#60a5fa",
+                "accent_recording": "#f87171",
+                "accent_playing": "#34d399",
+                "accent_message": "#fbbf24",
+                "border": "#2a2a2a"
+            },
+            "light": {
+                "card_bg": "#ffffff",
+                "text": "#1a1a1a",
+                "text_secondary": "#525252",
+                "text_dim": "#a3a3a3",
+                "accent_idle": "#3b82f6",
+                "accent_recording": "#ef4444",
+                "accent_playing": "#10b981",
+                "accent_message": "#f59e0b",
+                "border": "#d4d4d4"
+            }
+        }
+
+        colors = themes.get(theme, themes["dark"])
+        self.card_bg = colors["card_bg"]
+        self.text_color = colors["text"]
+        self.text_secondary = colors["text_secondary"]
+        self.text_dim = colors["text_dim"]
+        self.accent_idle = colors["accent_idle"]
+        self.accent_recording = colors["accent_recording"]
+        self.accent_playing = colors["accent_playing"]
+        self.accent_message = colors["accent_message"]
+        self.border_color = colors["border"]
+
+        # Цвета проверяются один раз здесь, дальше разбираются без проверок
+        for name, value in colors.items():
+            if not _HEX_COLOR.fullmatch(value):
+                raise ValueError(f"Invalid theme color {name}={value!r}, expected #rrggbb")
+
+        # Цвета темы как целые (r, g, b) - для смешивания без разбора hex
+        self._rgb = {
+            name: (int(h[1:3], 16), int(h[3:5], 16), int(h[5:7], 16))
+            for name, h in colors.items()
+        }
+
+        # Цвета пульсации рамки и полоски для каждого кадра: набор кадров
+        # и пары цветов фиксированы, в анимации остается выборка по индексу
+        accents = {"recording": "accent_recording", "playing": "accent_playing"}
+        pulse = [level / (_PULSE_LEVELS - 1) for level in _PULSE_LEVEL]
+        self._border_blend = {
+            status: tuple(self._blend_color(accent, "card_bg", 0.6 + p * 0.4) for p in pulse)
+            for status, accent in accents.items()
+        }
+        self._bar_blend = {
+            status: tuple(self._blend_color(accent, "card_bg", 0.7 + p * 0.3) for p in pulse)
+            for status, accent in accents.items()
+        }
+
+    def _schedule_frame(self) -> None:
+        """Запланировать такт отрисовки (если еще не запланирован)."""
+        if self._frame_after_id is None:
+            self._frame_after_id = self.root.after(self.FRAME_INTERVAL_MS, self._frame_tick)
+
+    def _frame_tick(self) -> None:
+        """
+        Такт отрисовки: не больше одной перерисовки за такт.
+
+        Рисует, если статус изменился (_dirty) или у пульсации сменился
+        видимый кадр; перепланируется, только пока статус анимирован.
+        В idle без изменений таймер не работает.
+        """
+        self._frame_after_id = None
+
+        # Скрытое окно не рисуется; такт снова запустит _resume_drawing()
+        if not self._is_visible():
+            return
+
+        animated = self.current_status in self.ANIMATED_STATUSES
+        anim_key = None
+        if animated:
+            self.animation_frame = (self.animation_frame + 1) % 60
+            self.pulse_alpha = _PULSE_TABLE[self.animation_frame]
+            # Видимые параметры кадра: данные, толщина рамки, оттенок
+            anim_key = (
+                self._last_update_data,
+                int(2 + self.pulse_alpha * 1),
+                _PULSE_LEVEL[self.animation_frame]
+            )
+
+        if self._dirty or anim_key != self._last_anim_key:
+            self._last_anim_key = anim_key
+            self.draw_ui()
+            if self._dirty:
+                self._dirty = False
+                # Новый статус - сразу на экран, не дожидаясь следующего прохода цикла
+                self.update()
+
+        if animated:
+            self._schedule_frame()
+
+    def _create_items(self) -> None:
+        """
+        Создать элементы canvas один раз.
+
+        Статичные элементы (подписи, разделитель, подсказка) больше не
+        трогаются; у динамических draw_ui() меняет только атрибуты.
+        """
+        canvas = self.canvas
+
+        # Отступы
+        padding = 15
+        header_y = 22
+        middle_y = 60
+        footer_y = self.height - 12
+
+        # Фон не рисуется отдельным прямоугольником: его дает bg=card_bg у canvas
+
+        # Рамка
+        self._id_border = canvas.create_rectangle(
+            0, 0, self.width, self.height,
+            fill="",
+            outline=self.border_color,
+            width=2,
+            tags="ui"
+        )
+
+        # Цветная полоска сверху
+        bar_height = 3
+        self._id_bar = canvas.create_rectangle(
+            0, 0, self.width, bar_height,
+            fill=self.accent_idle,
+            outline="",
+            tags="ui"
+        )
+
+        # === ВЕРХНЯЯ СЕКЦИЯ: Статус ===
+        self._id_status = canvas.create_text(
+            padding, header_y,
+            text="",
+            font=self.status_font,
+            fill=self.accent_idle,
+            anchor="w",
+            tags="ui"
+        )
+
+        # === СРЕДНЯЯ СЕКЦИЯ: Слот и События ===
+        canvas.create_text(
+            padding, middle_y - 10,
+            text="SLOT",
+            font=self.hint_font,
+            fill=self.text_dim,
+            anchor="w",
+            tags="ui"
+        )
+
+        self._id_slot = canvas.create_text(
+            padding, middle_y + 8,
+            text="",
+            font=self.slot_font,
+            fill=self.text_color,
+            anchor="w",
+            tags="ui"
+        )
+
+        # EVENTS (справа)
+        canvas.create_text(
+            self.width - padding, middle_y - 10,
+            text="EVENTS",
+            font=self.hint_font,
+            fill=self.text_dim,
+            anchor="e",
+            tags="ui"
+        )
+
+        self._id_count = canvas.create_text(
+            self.width - padding, middle_y + 8,
+            text="",
+            font=self.count_font,
+            fill=self.accent_idle,
+            anchor="e",
+            tags="ui"
+        )
+
+        # === НИЖНЯЯ СЕКЦИЯ ===
+        # Разделитель
+        canvas.create_line(
+            padding, footer_y - 10,
+            self.width - padding, footer_y - 10,
+            fill=self.border_color,
+            width=1,
+            tags="ui"
+        )
+
+        # Подсказка
+        canvas.create_text(
+            self.width // 2, footer_y,
+            text="Double-click to close • Right-click menu",
+            font=self.hint_font,
+            fill=self.text_dim,
+            anchor="center",
+            tags="ui"
+        )
+
+        # Уведомление (поверх остальных элементов, скрыто до show_message)
+        self._msg_rect_id = canvas.create_rectangle(
+            15, self.height // 2 - 18,
+            self.width - 15, self.height // 2 + 18,
+            fill=self.card_bg,
+            outline=self.accent_message,
+            width=2,
+            state="hidden",
+            tags="message"
+        )
+
+        self._msg_text_id = canvas.create_text(
+            self.width // 2, self.height // 2,
+            text="",
+            font=self.message_font,
+            fill=self.accent_message,
+            anchor="center",
+            state="hidden",
+            tags="message"
+        )
+
+    def draw_ui(self) -> None:
+        """Отрисовать минималистичный интерфейс (обновить атрибуты элементов)."""
+        itemconfig = self.canvas.itemconfig
+
+        # Определение цвета и текста статуса
+        status_map = {
+            "recording": (self.accent_recording, "RECORDING", "🔴"),
+            "playing": (self.accent_playing, "PLAYING", "▶️"),
+            "idle": (self.accent_idle, "READY", "⏸️")
+        }
+        accent, status_text, icon = status_map.get(self.current_status, (self.accent_idle, "READY", "⏸️"))
+
+        # Рамка и полоска сверху
+        border_width = 2
+        if self.current_status in self.ANIMATED_STATUSES:
+            # Пульсирующая рамка (цвета кадра - из таблиц _load_theme)
+            border_width = int(2 + self.pulse_alpha * 1)
+            border_color = self._border_blend[self.current_status][self.animation_frame]
+            bar_color = self._bar_blend[self.current_status][self.animation_frame]
+        else:
+            border_color = self.border_color
+            bar_color = accent
+
+        itemconfig(self._id_border, outline=border_color, width=border_width)
+        itemconfig(self._id_bar, fill=bar_color)
+
+        # Статус
+        itemconfig(self._id_status, text=f"{icon} {status_text}", fill=accent)
+
+        # Слот
+        itemconfig(self._id_slot, text=self._slot_display)
+
+        # События
+        itemconfig(self._id_count, text=str(self.event_count), fill=accent)
+
+    def _blend_color(self, color1: str, color2: str, alpha: float) -> str:
+        """
+        Смешать два цвета темы.
+
+        Args:
+            color1: Имя первого цвета темы (например "accent_recording")
+            color2: Имя второго цвета темы
+            alpha: Доля первого цвета (0.0-1.0)
+        """
+        r1, g1, b1 = self._rgb[color1]
+        r2, g2, b2 = self._rgb[color2]
+        beta = 1 - alpha
+
+        return '#%02x%02x%02x' % (
+            int(r1 * alpha + r2 * beta),
+            int(g1 * alpha + g2 * beta),
+            int(b1 * alpha + b2 * beta)
+        )
+
+    def update_status(
+        self,
+        status: str,
+        slot: Optional[int] = None,
+        event_count: Optional[int] = None,
+        slot_name: Optional[str] = None
+    ) -> None:
+        """Обновить статус."""
+        # Сначала сравниваем новые значения: повтор того же статуса
+        # (основной поток вызовов при записи) не трогает атрибуты
+        current_data = (
+            self.current_status if status is None else status,
+            self.current_slot if slot is None else slot,
+            self.event_count if event_count is None else event_count,
+            self.slot_name if slot_name is None else slot_name
+        )
+        if current_data == self._last_update_data:
+            return
+
+        self._last_update_data = current_data
+        self.current_status, self.current_slot, self.event_count, self.slot_name = current_data
+
+        # Текст слота готовится здесь, а не в каждом кадре draw_ui()
+        name = self.slot_name
+        if len(name) > 15:
+            name = name[:15] + "..."
+        self._slot_display = f"#{self.current_slot} {name}" if name else f"#{self.current_slot}"
+
+        # Серия вызовов за такт сливается в одну отрисовку в _frame_tick
+        self._dirty = True
+        self._schedule_frame()
+
+    def _is_visible(self) -> bool:
+        """Окно показано на экране и не полностью прозрачно."""
+        return self.alpha > 0 and bool(self.root.winfo_viewable())
+
+    def _resume_drawing(self, event: Optional[tk.Event] = None) -> None:
+        """Окно снова видно: дорисовать пропущенное и перезапустить анимацию."""
+        self._dirty = True
+        self._schedule_frame()
+
+    def show_message(self, message: str, duration: int = 2000) -> None:
+        """Показать уведомление."""
+        if self._message_after_id:
+            self.root.after_cancel(self._message_after_id)
+
+        # Элементы уведомления созданы заранее - меняется только текст и видимость
+        self.canvas.itemconfig(self._msg_text_id, text=message, state="normal")
+        self.canvas.itemconfig(self._msg_rect_id, state="normal")
+
+        self._message_after_id = self.root.after(duration, self._hide_message)
+
+    def _hide_message(self) -> None:
+        """Скрыть уведомление."""
+        self.canvas.itemconfig(self._msg_rect_id, state="hidden")
+        self.canvas.itemconfig(self._msg_text_id, state="hidden")
+        self._message_after_id = None
+
+    def _show_context_menu(self, event: tk.Event) -> None:
+        """Контекстное меню."""
+        try:
+            self._ctx_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._ctx_menu.grab_release()
+
+    def toggle_topmost(self) -> None:
+        """Переключить 'всегда поверх'."""
+        self.always_on_top = not self.always_on_top
+        self.root.attributes('-topmost', self.always_on_top)
+
+        status = "enabled" if self.always_on_top else "disabled"
+        self.show_message(f"Always on top {status}")
+        logger.info("Always on top: %s", self.always_on_top)
+
+    def set_alpha(self, alpha: float) -> None:
+        """Установить прозрачность."""
+        was_visible = self.alpha > 0
+        self.alpha = max(0.0, min(1.0, alpha))
+        self.root.attributes('-alpha', self.alpha)
+
+        # Прозрачный оверлей не перерисовывается - при показе догоняем состояние
+        if not was_visible and self.alpha > 0:
+            self._resume_drawing()
+
+    def _start_move(self, event: tk.Event) -> None:
+        """Начать перетаскивание."""
+        self.offset_x = event.x
+        self.offset_y = event.y
+
+    def _do_move(self, event: tk.Event) -> None:
+        """Перетащить окно (не чаще одного geometry() за цикл простоя Tk)."""
+        # Экранные координаты курсора: не зависят от еще не примененного сдвига
+        self._pending_pos = (event.x_root - self.offset_x, event.y_root - self.offset_y)
+        if self._move_after_id is None:
+            self._move_after_id = self.root.after_idle(self._apply_move)
+
+    def _apply_move(self) -> None:
+        """Переместить окно в последнюю позицию перетаскивания."""
+        self._move_after_id = None
+        if self._pending_pos is not None:
+            x, y = self._pending_pos
+            self._pending_pos = None
+            self.root.geometry(f'+{x}+{y}')
+
+    def _on_close(self, event: Optional[tk.Event] = None) -> None:
+        """Обработать закрытие."""
+        self.close_requested = True
+        if self.on_close:
+            self.on_close()
+        self.root.quit()
+
+    def update(self) -> None:
+        """Обновить окно: выполнить отложенные перерисовки без обработки ввода."""
+        try:
+            self.root.update_idletasks()
+        except tk.TclError:
+            pass
+
+    def pump_events(self) -> None:
+        """Обработать все события Tk (ввод, таймеры, перерисовка) - для внешнего цикла."""
+        try:
+            self.root.update()
+        except tk.TclError:
+            pass
+
+    def _cancel_pending(self) -> None:
+        """Отменить все запланированные after-вызовы (такт, скрытие сообщения, перенос)."""
+        for attr in ('_frame_after_id', '_message_after_id', '_move_after_id'):
+            after_id = getattr(self, attr)
+            if after_id is not None:
+                setattr(self, attr, None)
+                try:
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+
+    def _on_destroy(self, event: tk.Event) -> None:
+        """Окно уничтожается (в том числе не через destroy()) - таймеры больше не нужны."""
+        # <Destroy> привязан к root и приходит также от дочерних виджетов
+        if event.widget is self.root:
+            self._cancel_pending()
+
+    def destroy(self) -> None:
+        """Уничтожить окно."""
+        self._cancel_pending()
+        try:
+            self.root.destroy()
+        except:
+            pass
@@ -4,17 +4,14 @@ Hollow Knight Gamepad Recorder v2.0
 """
 
 import sys
+import time
 import pygame
 import logging
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from config_manager import ConfigManager
-from logger_config import setup_logging
-from recorder.gamepad_recorder import GamepadRecorder, RecorderState
-from ui.overlay_gui import OverlayGUI
+from hkrecorder.config_manager import ConfigManager
+from hkrecorder.logger_config import setup_logging, shutdown_logging
+from hkrecorder.recorder.gamepad_recorder import GamepadRecorder, RecorderState
+from hkrecorder.ui.overlay_gui import OverlayGUI
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +19,33 @@ logger = logging.getLogger(__name__)
 class GamepadRecorderApp:
     """Main application."""
 
+    _STATUS_MAP = {
+        RecorderState.IDLE: "idle",
+        RecorderState.RECORDING: "recording",
+        RecorderState.PLAYING: "playing"
+    }
+
+    _STATE_MESSAGES = {
+        RecorderState.RECORDING: "🔴 Recording...",
+        RecorderState.PLAYING: "▶️ Playing..."
+    }
+
+    # Timer event that paces GUI updates (posted by SDL at ui.update_rate)
+    GUI_TICK_EVENT = pygame.USEREVENT + 1
+
     def __init__(self):
         # Load configuration
         self.config = ConfigManager()
+        self.cfg = self.config.app_config()
+        cfg = self.cfg
 
         # Setup logging
-        log_config = self.config.get('logging', {})
         setup_logging(
-            level=log_config.get('level', 'INFO'),
-            log_file=log_config.get('file'),
-            console=log_config.get('console', True),
-            max_bytes=log_config.get('max_file_size', 10485760),
-            backup_count=log_config.get('backup_count', 3)
+            level=cfg.logging_level,
+            log_file=cfg.logging_file,
+            console=cfg.logging_console,
+            max_bytes=cfg.logging_max_file_size,
+            backup_count=cfg.logging_backup_count
         )
 
         logger.info("=" * 60)
@@ -41,35 +53,31 @@ class GamepadRecorderApp:
         logger.info("=" * 60)
 
         # Create recorder
-        gamepad_config = self.config.get('gamepad', {})
-        recording_config = self.config.get('recording', {})
-
         self.recorder = GamepadRecorder(
-            record_button=gamepad_config.get('record_button', 8),
-            play_button=gamepad_config.get('play_button', 9),
-            stick_deadzone=gamepad_config.get('stick_deadzone', 0.1),
-            trigger_deadzone=gamepad_config.get('trigger_deadzone', 0.05),
-            interference_threshold=gamepad_config.get('interference_threshold', 0.2),
-            max_slots=recording_config.get('max_slots', 30),
-            max_events=recording_config.get('max_events_per_slot', 100000),
-            recordings_dir=recording_config.get('recordings_dir', 'recordings'),
-            invert_left_stick_y=gamepad_config.get('invert_left_stick_y', True),
-            quantize_sticks=gamepad_config.get('quantize_sticks', True),
-            auto_save=recording_config.get('auto_save', True)
+            record_button=cfg.gamepad_record_button,
+            play_button=cfg.gamepad_play_button,
+            stick_deadzone=cfg.gamepad_stick_deadzone,
+            trigger_deadzone=cfg.gamepad_trigger_deadzone,
+            interference_threshold=cfg.gamepad_interference_threshold,
+            max_slots=cfg.recording_max_slots,
+            max_events=cfg.recording_max_events_per_slot,
+            recordings_dir=cfg.recording_recordings_dir,
+            invert_left_stick_y=cfg.gamepad_invert_left_stick_y,
+            quantize_sticks=cfg.gamepad_quantize_sticks,
+            auto_save=cfg.recording_auto_save
         )
 
         # GUI
         self.gui: OverlayGUI | None = None
-        ui_config = self.config.get('ui', {})
 
-        if ui_config.get('overlay_enabled', True):
+        if cfg.ui_overlay_enabled:
             self.gui = OverlayGUI(
-                position=ui_config.get('overlay_position', 'top-right'),
-                alpha=ui_config.get('overlay_alpha', 0.92),
-                width=ui_config.get('overlay_width', 200),
-                height=ui_config.get('overlay_height', 70),
-                always_on_top=ui_config.get('always_on_top', True),
-                theme=ui_config.get('theme', 'dark')
+                position=cfg.ui_overlay_position,
+                alpha=cfg.ui_overlay_alpha,
+                width=cfg.ui_overlay_width,
+                height=cfg.ui_overlay_height,
+                always_on_top=cfg.ui_always_on_top,
+                theme=cfg.ui_theme
             )
 
             # Bind callbacks
@@ -78,54 +86,56 @@ class GamepadRecorderApp:
             self.recorder.on_error = self._on_error
             self.gui.on_close = self._on_gui_close
 
-        # Settings
-        self.playback_config = self.config.get('playback', {})
-        self.hotkeys = self.config.get('hotkeys', {})
-        self.auto_save = recording_config.get('auto_save', True)
-        self.backup_on_save = recording_config.get('backup_on_save', True)
+        # Hotkey dispatch table (pygame keycode -> handler)
+        hotkey_handlers = [
+            ('save', cfg.hotkeys_save, self._save_sequences),
+            ('load', cfg.hotkeys_load, self._load_sequences),
+            ('quit', cfg.hotkeys_quit, self._quit),
+        ]
+        if self.gui:
+            hotkey_handlers += [
+                ('toggle_overlay', cfg.hotkeys_toggle_overlay, self._toggle_overlay),
+                ('toggle_topmost', cfg.hotkeys_toggle_topmost, self.gui.toggle_topmost),
+            ]
+
+        self._hotkey_dispatch = {}
+        for name, key, handler in hotkey_handlers:
+            try:
+                self._hotkey_dispatch[pygame.key.key_code(key)] = handler
+            except ValueError:
+                logger.warning("Unknown key '%s' for hotkey '%s'", key, name)
 
         # Flags
         self.running = True
-        self.ui_update_counter = 0
-        self.ui_update_rate = ui_config.get('update_rate', 10)
 
     def _on_state_change(self, state: RecorderState, slot: int, event_count: int) -> None:
         """State change handler."""
         if not self.gui:
             return
 
-        status_map = {
-            RecorderState.IDLE: "idle",
-            RecorderState.RECORDING: "recording",
-            RecorderState.PLAYING: "playing"
-        }
-
         # Get slot name
-        meta = self.recorder.sequence_manager.get_metadata(slot)
-        slot_name = meta.name if meta else ""
+        _, slot_name = self.recorder.sequence_manager.slot_info(slot)
 
         self.gui.update_status(
-            status=status_map.get(state, "idle"),
+            status=self._STATUS_MAP.get(state, "idle"),
             slot=slot,
             event_count=event_count,
             slot_name=slot_name
         )
 
         # Messages
-        if state == RecorderState.IDLE and event_count > 0:
+        message = self._STATE_MESSAGES.get(state)
+        if message:
+            self.gui.show_message(message)
+        elif state == RecorderState.IDLE and event_count > 0:
             self.gui.show_message(f"💾 {event_count} events")
-        elif state == RecorderState.RECORDING:
-            self.gui.show_message("🔴 Recording...")
-        elif state == RecorderState.PLAYING:
-            self.gui.show_message("▶️ Playing...")
 
     def _on_slot_change(self, slot: int, event_count: int) -> None:
         """Slot change handler."""
         if not self.gui:
             return
 
-        meta = self.recorder.sequence_manager.get_metadata(slot)
-        slot_name = meta.name if meta else ""
+        _, slot_name = self.recorder.sequence_manager.slot_info(slot)
 
         self.gui.update_status(
             status="idle",
@@ -145,46 +155,48 @@ class GamepadRecorderApp:
         self.running = False
 
     def _process_keyboard_input(self) -> None:
-        """Process keyboard input."""
-        for event in pygame.event.get():
-            if event.type != pygame.KEYDOWN:
-                continue
+        """Process keyboard input and GUI tick events."""
+        # The queue was already pumped by the joystick event pass this frame;
+        # KEYDOWN/GUI tick are filtered in SDL, the rest is dropped so it can't pile up
+        wanted = (pygame.KEYDOWN, self.GUI_TICK_EVENT)
+        if not pygame.event.peek(wanted, pump=False):
+            # Idle frame: nothing to dispatch, just drop the unrelated events
+            pygame.event.clear(pump=False)
+            return
 
-            key = pygame.key.name(event.key)
+        events = pygame.event.get(wanted, pump=False)
+        pygame.event.clear(pump=False)
 
-            # Save
-            if key == self.hotkeys.get('save', 's'):
-                self._save_sequences()
+        for event in events:
+            if event.type == self.GUI_TICK_EVENT:
+                if self.gui:
+                    self.gui.pump_events()
+                continue
 
-            # Load
-            elif key == self.hotkeys.get('load', 'l'):
-                self._load_sequences()
+            key = event.key
 
-            # Quit
-            elif key == self.hotkeys.get('quit', 'q'):
-                self.running = False
+            handler = self._hotkey_dispatch.get(key)
+            if handler:
+                handler()
 
-            # Toggle overlay
-            elif key == self.hotkeys.get('toggle_overlay', 'o') and self.gui:
-                # Hide/show (change alpha)
-                new_alpha = 0.0 if self.gui.alpha > 0.1 else 0.92
-                self.gui.set_alpha(new_alpha)
-                logger.info(f"Overlay alpha: {new_alpha}")
+            # Quick slot select (1-9)
+            elif pygame.K_1 <= key <= pygame.K_9:
+                self.recorder.goto_slot(key - pygame.K_0)
 
-            # Toggle topmost
-            elif key == self.hotkeys.get('toggle_topmost', 't') and self.gui:
-                self.gui.toggle_topmost()
+    def _quit(self) -> None:
+        """Quit hotkey handler."""
+        self.running = False
 
-            # Quick slot select (1-9)
-            elif key.isdigit():
-                slot = int(key)
-                if 1 <= slot <= 9:
-                    self.recorder.goto_slot(slot)
+    def _toggle_overlay(self) -> None:
+        """Hide/show overlay (change alpha)."""
+        new_alpha = 0.0 if self.gui.alpha > 0.1 else 0.92
+        self.gui.set_alpha(new_alpha)
+        logger.info("Overlay alpha: %s", new_alpha)
 
     def _save_sequences(self) -> None:
         """Save sequences."""
         success = self.recorder.sequence_manager.save_to_file(
-            backup=self.backup_on_save
+            backup=self.cfg.recording_backup_on_save
         )
 
         if success:
@@ -198,22 +210,24 @@ class GamepadRecorderApp:
 
     def _load_sequences(self) -> None:
         """Load sequences."""
-        success = self.recorder.sequence_manager.load_from_file()
+        result = self.recorder.sequence_manager.load_from_file(
+            current_slot=self.recorder.current_slot
+        )
 
-        if success:
+        if result:
             logger.info("Sequences loaded")
             if self.gui:
                 # Update current slot display
-                count = len(self.recorder.sequence_manager.get_sequence(self.recorder.current_slot))
-                meta = self.recorder.sequence_manager.get_metadata(self.recorder.current_slot)
-
                 self.gui.update_status(
                     status="idle",
-                    slot=self.recorder.current_slot,
-                    event_count=count,
-                    slot_name=meta.name if meta else ""
+                    slot=result.current_slot,
+                    event_count=result.current_slot_count,
+                    slot_name=result.current_slot_name
                 )
-                self.gui.show_message("📂 Loaded!")
+                if result.skipped_slots:
+                    self.gui.show_message(f"⚠️ Loaded, {len(result.skipped_slots)} slot(s) skipped")
+                else:
+                    self.gui.show_message("📂 Loaded!")
         else:
             logger.error("Load failed")
             if self.gui:
@@ -232,59 +246,80 @@ class GamepadRecorderApp:
             return 1
 
         # Auto-load
-        if self.auto_save:
-            if self.recorder.sequence_manager.load_from_file():
-                # Update GUI with loaded data
-                if self.gui:
-                    count = len(self.recorder.sequence_manager.get_sequence(self.recorder.current_slot))
-                    meta = self.recorder.sequence_manager.get_metadata(self.recorder.current_slot)
-                    self.gui.update_status(
-                        status="idle",
-                        slot=self.recorder.current_slot,
-                        event_count=count,
-                        slot_name=meta.name if meta else ""
-                    )
+        if self.cfg.recording_auto_save:
+            result = self.recorder.sequence_manager.load_from_file(
+                current_slot=self.recorder.current_slot
+            )
+            # Update GUI with loaded data
+            if result and self.gui:
+                self.gui.update_status(
+                    status="idle",
+                    slot=result.current_slot,
+                    event_count=result.current_slot_count,
+                    slot_name=result.current_slot_name
+                )
 
         # Print info
         logger.info("")
         logger.info("📋 Controls:")
-        logger.info(f"  🔴 Record: L3 (button {self.recorder.record_button})")
-        logger.info(f"  ▶️  Playback: R3 (button {self.recorder.play_button})")
-        logger.info(f"  ⬆️⬇️  Slots: D-pad")
-        logger.info(f"  💾 Save: '{self.hotkeys.get('save', 's')}'")
-        logger.info(f"  📂 Load: '{self.hotkeys.get('load', 'l')}'")
-        logger.info(f"  👁️  Toggle overlay: '{self.hotkeys.get('toggle_overlay', 'o')}'")
-        logger.info(f"  📌 Toggle topmost: '{self.hotkeys.get('toggle_topmost', 't')}'")
-        logger.info(f"  1-9: Quick slot select")
-        logger.info(f"  ❌ Quit: '{self.hotkeys.get('quit', 'q')}' or double-click")
+        logger.info("  🔴 Record: L3 (button %s)", self.recorder.record_button)
+        logger.info("  ▶️  Playback: R3 (button %s)", self.recorder.play_button)
+        logger.info("  ⬆️⬇️  Slots: D-pad")
+        logger.info("  💾 Save: '%s'", self.cfg.hotkeys_save)
+        logger.info("  📂 Load: '%s'", self.cfg.hotkeys_load)
+        logger.info("  👁️  Toggle overlay: '%s'", self.cfg.hotkeys_toggle_overlay)
+        logger.info("  📌 Toggle topmost: '%s'", self.cfg.hotkeys_toggle_topmost)
+        logger.info("  1-9: Quick slot select")
+        logger.info("  ❌ Quit: '%s' or double-click", self.cfg.hotkeys_quit)
         logger.info("")
-        logger.info(f"Current slot: {self.recorder.current_slot}")
+        logger.info("Current slot: %s", self.recorder.current_slot)
         logger.info("Application started!")
 
         # Main loop
-        clock = pygame.time.Clock()
-        polling_rate = self.config.get('gamepad.polling_rate', 100)
+        polling_rate = self.cfg.gamepad_polling_rate
+        frame_time = 1.0 / polling_rate
 
-        while self.running:
-            # Process input
-            self.recorder.process_input()
-            self._process_keyboard_input()
+        if self.gui:
+            pygame.time.set_timer(self.GUI_TICK_EVENT, max(1, 1000 // self.cfg.ui_update_rate))
+
+        # Frame deadlines are absolute, so time spent in process_input/GUI
+        # and sleep overshoot are compensated on the next frame instead of
+        # accumulating (clock.tick() drifts below polling_rate under load)
+        next_frame = time.perf_counter()
+        joystick_events = [
+            pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+            pygame.JOYAXISMOTION, pygame.JOYHATMOTION
+        ]
+
+        # Local aliases: the loop runs polling_rate times per second
+        get_events = pygame.event.get
+        process_events = self.recorder.process_events_batch
+        process_keyboard = self._process_keyboard_input
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+        gui = self.gui
 
-            # Update GUI (at lower rate)
-            if self.gui:
-                self.ui_update_counter += 1
-                if self.ui_update_counter >= polling_rate // self.ui_update_rate:
-                    self.gui.update()
-                    self.ui_update_counter = 0
+        while self.running:
+            # Process input (all joystick events queued since the last frame)
+            process_events(get_events(joystick_events))
+            process_keyboard()
 
-                if self.gui.close_requested:
-                    self.running = False
+            # GUI events are pumped on GUI_TICK_EVENT in _process_keyboard_input
+            if gui and gui.close_requested:
+                self.running = False
 
             # FPS limit
-            clock.tick(polling_rate)
+            next_frame += frame_time
+            delay = next_frame - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            elif delay < -frame_time:
+                # Fell more than a frame behind - resync instead of bursting
+                next_frame = perf_counter()
 
         # Cleanup
         logger.info("Shutting down...")
+        pygame.time.set_timer(self.GUI_TICK_EVENT, 0)
 
         # Stop recording/playback if active
         if self.recorder.state == RecorderState.RECORDING:
@@ -293,7 +328,7 @@ class GamepadRecorderApp:
             self.recorder.stop_playback()
 
         # Auto-save
-        if self.auto_save:
+        if self.cfg.recording_auto_save:
             self._save_sequences()
 
         self.recorder.cleanup()
@@ -314,8 +349,10 @@ def main() -> int:
         logger.info("Interrupted by user")
         return 0
     except Exception as e:
-        logger.exception(f"Critical error: {e}")
+        logger.exception("Critical error: %s", e)
         return 1
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":